@@ -151,6 +151,12 @@ class HandoffFlow:
                 return item
             return None
 
+    def reset(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._by_corr.clear()
+            self._by_user.clear()
+
     def clear(self, *, correlation_id: Optional[str], user_id: Optional[str], token: Optional[str]) -> None:
         self.pop(correlation_id=correlation_id, user_id=user_id, token=token)
 
@@ -1,11 +1,12 @@
 ﻿from __future__ import annotations
 
 import logging
+import math
 import re
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from statistics import mean
-from typing import Dict, Optional
+from typing import Deque, Dict, Optional
 
 from app.agents.base import Agent, AgentRequest, AgentResponse
 from app.agents.handoff_flow import PendingHandoff, get_handoff_flow
@@ -14,29 +15,43 @@ from app.settings import settings
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_LONG_DIGITS_RE = re.compile(r"\b\d{5,}\b")
+# emails and long digit runs in one scan; _mask_match tells them apart by group
+_PII_RE = re.compile(r"[\w._%+-]+@(?P<domain>[\w.-]+)|\b\d{5,}\b")
+
 
 @dataclass
 class SlackMetrics:
     attempts: int = 0
     success: int = 0
     failed: int = 0
-    latencies_ms: list[float] = field(default_factory=list)
     max_samples: int = 2000
+    # bounded ring buffer: appending past max_samples drops the oldest value in O(1)
+    _latencies: Deque[float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._latencies = deque(maxlen=self.max_samples)
 
     def add_latency(self, value: float) -> None:
-        self.latencies_ms.append(value)
-        if len(self.latencies_ms) > self.max_samples:
-            self.latencies_ms.pop(0)
+        self._latencies.append(value)
+
+    @property
+    def latencies_ms(self) -> list[float]:
+        return list(self._latencies)
 
     @property
     def average_latency_ms(self) -> float:
-        return round(mean(self.latencies_ms), 2) if self.latencies_ms else 0.0
+        if not self._latencies:
+            return 0.0
+        # fsum is exactly rounded like statistics.mean, without its Fraction arithmetic
+        return round(math.fsum(self._latencies) / len(self._latencies), 2)
 
     @property
     def p95_latency_ms(self) -> float:
-        if not self.latencies_ms:
+        if not self._latencies:
             return 0.0
-        ordered = sorted(self.latencies_ms)
+        ordered = sorted(self._latencies)
         index = max(0, int(len(ordered) * 0.95) - 1)
         return round(ordered[index], 2)
 
@@ -213,8 +228,7 @@ class SlackAgent(Agent):
     def _normalise(text: str) -> str:
         if not text:
             return ""
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
+        return _WHITESPACE_RE.sub(" ", text).strip()
 
     def _response(self, content: str, meta: Optional[Dict[str, object]] = None) -> AgentResponse:
         meta = meta or {}
@@ -246,9 +260,15 @@ def _mask_value(value: Optional[str]) -> Optional[str]:
         return None
     if not settings.pii_masking_enabled:
         return value
-    masked = re.sub(r"([\w._%+-]+)@([\w.-]+)", r"***@\2", value)
-    masked = re.sub(r"\b\d{5,}\b", "***", masked)
-    return masked
+    return _PII_RE.sub(_mask_match, value)
+
+
+def _mask_match(match: re.Match[str]) -> str:
+    domain = match.group("domain")
+    if domain is None:
+        return "***"
+    # digit runs inside the domain are masked as well
+    return "***@" + _LONG_DIGITS_RE.sub("***", domain)
 
 
 _slack_agent: Optional[SlackAgent] = None
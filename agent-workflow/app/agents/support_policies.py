@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Dict
 
@@ -33,7 +34,7 @@ ESCALATION_REQUEST_TERMS = ["falar com humano", "atendente", "suporte humano", "
 REPEAT_ISSUE_TERMS = ["de novo", "novamente", "mais uma vez", "continua", "nada resolvido"]
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyDecision:
     category: str
     priority: str
@@ -60,9 +61,15 @@ for level, terms in SEVERITY_CUSTOM.items():
     bucket = SEVERITY_TERMS.setdefault(level.lower(), [])
     bucket.extend(terms)
 
+# a request for a human and a repeated issue both escalate, so one search covers both lists
+_ESCALATION_TRIGGER_RE = re.compile("|".join(re.escape(term) for term in ESCALATION_REQUEST_TERMS + REPEAT_ISSUE_TERMS))
+
 
 def classify_category(message: str) -> str:
-    text = message.lower()
+    return _classify_category(message.lower())
+
+
+def _classify_category(text: str) -> str:
     for category, terms in CATEGORY_TERMS.items():
         if any(term in text for term in terms):
             return category
@@ -70,7 +77,10 @@ def classify_category(message: str) -> str:
 
 
 def classify_priority_and_escalation(message: str) -> tuple[str, bool]:
-    text = message.lower()
+    return _classify_priority_and_escalation(message.lower())
+
+
+def _classify_priority_and_escalation(text: str) -> tuple[str, bool]:
     for term in SEVERITY_TERMS.get("critical", []):
         if term in text:
             return "critical", True
@@ -82,21 +92,13 @@ def classify_priority_and_escalation(message: str) -> tuple[str, bool]:
     return "low", False
 
 
-def _has_request_for_human(text: str) -> bool:
-    return any(term in text for term in ESCALATION_REQUEST_TERMS)
-
-
-def _looks_like_repeat_issue(text: str) -> bool:
-    return any(term in text for term in REPEAT_ISSUE_TERMS)
-
-
 def decide(message: str) -> PolicyDecision:
     text = message.lower()
-    category = classify_category(text)
-    priority, base_escalation = classify_priority_and_escalation(text)
+    category = _classify_category(text)
+    priority, base_escalation = _classify_priority_and_escalation(text)
 
     escalation = base_escalation
-    if _has_request_for_human(text) or _looks_like_repeat_issue(text):
+    if _ESCALATION_TRIGGER_RE.search(text):
         escalation = True
     if settings.support_escalation_auto and priority in {"critical", "high"}:
         escalation = True
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, List, Tuple
 
 from app.settings import settings
@@ -37,40 +38,64 @@ _DEFAULT_PATTERNS: Tuple[InjectionPattern, ...] = (
 )
 
 
-def _configured_patterns() -> Iterable[InjectionPattern]:
-    configured = settings.guardrails_anti_injection_patterns or ""
+_WHITESPACE_RUN = re.compile(r"\s{2,}")
+
+
+def _configured_patterns(configured: str) -> Iterable[InjectionPattern]:
     for raw in configured.split(";"):
         text = raw.strip()
         if text:
             yield InjectionPattern(text.lower())
 
 
-def _patterns() -> List[InjectionPattern]:
+@lru_cache(maxsize=32)
+def _compiled_patterns(configured: str) -> Tuple[Tuple[str, re.Pattern[str]], ...]:
+    """Compile the default and configured patterns once per settings value."""
     merged: List[InjectionPattern] = list(_DEFAULT_PATTERNS)
-    merged.extend(_configured_patterns())
-    unique: List[InjectionPattern] = []
+    merged.extend(_configured_patterns(configured))
+    unique: List[Tuple[str, re.Pattern[str]]] = []
     seen: set[str] = set()
     for pattern in merged:
         key = pattern.value.lower()
         if key in seen:
             continue
         seen.add(key)
-        unique.append(pattern)
-    return unique
+        unique.append((pattern.value, pattern.regex()))
+    return tuple(unique)
+
+
+@lru_cache(maxsize=32)
+def _prefilter(configured: str) -> re.Pattern[str]:
+    """One alternation over every pattern: matches iff at least one pattern would."""
+    return re.compile(
+        "|".join(f"(?:{regex.pattern})" for _, regex in _compiled_patterns(configured)),
+        re.IGNORECASE,
+    )
+
+
+def contains_injection(text: str) -> bool:
+    """Same verdict as ``cleanse_injection(text)[1]`` without rewriting the text."""
+    if not text:
+        return False
+    return _prefilter(settings.guardrails_anti_injection_patterns or "").search(text) is not None
 
 
 def cleanse_injection(text: str) -> Tuple[str, bool, List[str]]:
     if not text:
         return "", False, []
 
+    configured = settings.guardrails_anti_injection_patterns or ""
+    if not _prefilter(configured).search(text):
+        # clean messages (the common case) are scanned once instead of once per pattern
+        return _WHITESPACE_RUN.sub(" ", text).strip(), False, []
+
     detected: List[str] = []
     cleaned = text
 
-    for pattern in _patterns():
-        regex = pattern.regex()
+    for value, regex in _compiled_patterns(configured):
         if regex.search(cleaned):
-            detected.append(pattern.value)
+            detected.append(value)
             cleaned = regex.sub("", cleaned)
 
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
+    cleaned = _WHITESPACE_RUN.sub(" ", cleaned).strip()
     return cleaned, bool(detected), detected
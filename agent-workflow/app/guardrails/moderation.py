@@ -1,6 +1,8 @@
 ﻿from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 from app.settings import settings
@@ -160,10 +162,11 @@ _CATEGORY_PRIORITY = {
 }
 
 
-def _blocklist() -> List[ModerationRule]:
-    configured = settings.guardrails_moderation_blocklist_terms or ""
+@lru_cache(maxsize=32)
+def _blocklist(configured: str, strict: bool) -> Tuple[ModerationRule, ...]:
+    """Build the priority-ordered rule list once per settings combination."""
     rules: List[ModerationRule] = list(_BALANCED_DEFAULT)
-    if settings.guardrails_mode == "strict":
+    if strict:
         rules.extend(_STRICT_EXTRA)
 
     for raw in configured.split(";"):
@@ -193,7 +196,14 @@ def _blocklist() -> List[ModerationRule]:
             rule.term,
         )
     )
-    return unique
+    return tuple(unique)
+
+
+@lru_cache(maxsize=32)
+def _blocklist_prefilter(configured: str, strict: bool) -> re.Pattern[str]:
+    """Alternation over every blocked term: matches iff at least one term occurs."""
+    terms = sorted({rule.term for rule in _blocklist(configured, strict) if rule.term}, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, terms)))
 
 
 def _format_safe_message(reason: ModerationRule) -> str:
@@ -205,11 +215,17 @@ def _format_safe_message(reason: ModerationRule) -> str:
 
 
 def moderate_text(text: str) -> Tuple[str, bool, Optional[dict]]:
-    if not settings.guardrails_moderation_enabled or settings.guardrails_mode == "off":
+    mode = settings.guardrails_mode
+    if not settings.guardrails_moderation_enabled or mode == "off":
         return text, False, None
 
+    configured = settings.guardrails_moderation_blocklist_terms or ""
+    strict = mode == "strict"
     lowered = text.lower()
-    for term in _blocklist():
+    if not _blocklist_prefilter(configured, strict).search(lowered):
+        return text, False, None
+    # a hit: walk the rules in priority order so the reported trigger is unchanged
+    for term in _blocklist(configured, strict):
         if term.term and term.term in lowered:
             safe_message = _format_safe_message(term)
             reason = {
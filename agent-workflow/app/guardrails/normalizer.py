@@ -2,6 +2,7 @@
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import Tuple
 
 from app.settings import settings
@@ -17,10 +18,8 @@ def _decode_symbol_token(token: str) -> str:
         return token
 
 
-def _strip_symbols(text: str) -> str:
-    raw = settings.guardrails_normalize_strip_symbols or ""
-    if not raw:
-        return text
+@lru_cache(maxsize=32)
+def _symbol_translation(raw: str) -> dict[int, str]:
     translation: dict[int, str] = {}
     for part in raw.split(","):
         token = part.strip()
@@ -29,6 +28,14 @@ def _strip_symbols(text: str) -> str:
         decoded = _decode_symbol_token(token)
         for char in decoded:
             translation[ord(char)] = " "
+    return translation
+
+
+def _strip_symbols(text: str) -> str:
+    raw = settings.guardrails_normalize_strip_symbols or ""
+    if not raw:
+        return text
+    translation = _symbol_translation(raw)
     return text.translate(translation) if translation else text
 
 
@@ -39,11 +46,14 @@ def normalise_text(text: str) -> Tuple[str, bool]:
     original = text
     normalised = text
 
-    if settings.guardrails_normalize_remove_accents:
+    # pure-ASCII messages (most chat traffic) carry no accents to fold
+    if settings.guardrails_normalize_remove_accents and not text.isascii():
         normalised = strip_portuguese_accents(normalised)
-        normalised = unicodedata.normalize("NFD", normalised)
-        normalised = "".join(ch for ch in normalised if unicodedata.category(ch) != "Mn")
-        normalised = unicodedata.normalize("NFC", normalised)
+        if not normalised.isascii():
+            # only text the translation table could not fold needs the decomposition pass
+            normalised = unicodedata.normalize("NFD", normalised)
+            normalised = "".join(ch for ch in normalised if unicodedata.category(ch) != "Mn")
+            normalised = unicodedata.normalize("NFC", normalised)
 
     normalised = _strip_symbols(normalised)
     normalised = _REMOVABLE_PATTERN.sub(" ", normalised)
@@ -1,7 +1,7 @@
 ﻿from __future__ import annotations
 
 import re
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 
 from app.settings import settings
 
@@ -9,6 +9,8 @@ EMAIL_RE = re.compile(r"([\w._%+-]+)@([\w.-]+)")
 PHONE_RE = re.compile(r"\b\+?\d[\d\s\-]{7,}\b")
 CARD_RE = re.compile(r"\b(?:\d[ -]?){13,19}\b")
 SSN_RE = re.compile(r"\b\d{3}-\d{2}-\d{4}\b")
+_NON_DIGIT_RE = re.compile(r"\D")
+_TICKET_PREFIX_RE = re.compile(r"[A-Z]{3,}-$")
 
 
 def _append_reason(reasons: List[str], category: str, trigger: str) -> None:
@@ -24,49 +26,56 @@ def mask_text(text: str) -> Tuple[str, bool, List[str]]:
     reasons: List[str] = []
 
     if settings.pii_mask_email:
-        if EMAIL_RE.search(masked):
+        masked, email_count = EMAIL_RE.subn(lambda m: _mask_email(m.group(1), m.group(2)), masked)
+        if email_count:
             flagged = True
-            masked = EMAIL_RE.sub(lambda m: _mask_email(m.group(1), m.group(2)), masked)
             _append_reason(reasons, "personal_identifiers", "email")
 
     if settings.pii_mask_phone:
-        phone_matches = list(PHONE_RE.finditer(masked))
-        phone_replacements = False
-        for match in reversed(phone_matches):
-            if _should_skip_phone_mask(masked, match):
-                continue
-            flagged = True
-            phone_replacements = True
-            masked = masked[: match.start()] + _mask_phone(match) + masked[match.end():]
+        masked, phone_replacements = _sub_matches(PHONE_RE, masked, _mask_phone, _should_skip_phone_mask)
         if phone_replacements:
+            flagged = True
             _append_reason(reasons, "personal_identifiers", "phone")
 
-    card_matches = list(CARD_RE.finditer(masked))
-    card_replacements = False
-    for match in reversed(card_matches):
-        if _should_skip_card_mask(masked, match):
-            continue
-        flagged = True
-        card_replacements = True
-        masked = masked[: match.start()] + _mask_card_number(match) + masked[match.end():]
+    masked, card_replacements = _sub_matches(CARD_RE, masked, _mask_card_number, _should_skip_card_mask)
     if card_replacements:
+        flagged = True
         _append_reason(reasons, "payment_data", "card_number")
 
-    if SSN_RE.search(masked):
+    masked, ssn_count = SSN_RE.subn(_mask_ssn, masked)
+    if ssn_count:
         flagged = True
-        masked = SSN_RE.sub(_mask_ssn, masked)
         _append_reason(reasons, "personal_identifiers", "ssn")
 
     return masked, flagged, reasons
 
 
+def _sub_matches(
+    pattern: re.Pattern[str],
+    text: str,
+    mask: Callable[[re.Match[str]], str],
+    skip: Callable[[str, re.Match[str]], bool],
+) -> Tuple[str, bool]:
+    """Mask every match not vetoed by ``skip`` in a single ``sub`` pass."""
+    replaced = False
+
+    def _replace(match: re.Match[str]) -> str:
+        nonlocal replaced
+        if skip(text, match):
+            return match.group(0)
+        replaced = True
+        return mask(match)
+
+    return pattern.sub(_replace, text), replaced
+
+
 def _mask_email(local: str, domain: str) -> str:
     visible = local[:2] if len(local) > 2 else "*"
     return f"{visible}{'*' * max(1, len(local) - len(visible))}@{domain}"
 
 
 def _mask_phone(match: re.Match[str]) -> str:
-    digits = re.sub(r"\D", "", match.group(0))
+    digits = _NON_DIGIT_RE.sub("", match.group(0))
     if len(digits) <= 4:
         return "*" * len(digits)
     prefix = "*" * (len(digits) - 2)
@@ -80,11 +89,11 @@ def _should_skip_card_mask(text: str, match: re.Match[str]) -> bool:
     return _has_ticket_prefix(text, match)
 
 def _has_ticket_prefix(text: str, match: re.Match[str]) -> bool:
-    prefix = text[: match.start()]
-    return bool(re.search(r"[A-Z]{3,}-$", prefix))
+    # endpos makes "$" anchor at the match start without copying the prefix
+    return _TICKET_PREFIX_RE.search(text, 0, match.start()) is not None
 
 def _mask_card_number(match: re.Match[str]) -> str:
-    digits = re.sub(r"\D", "", match.group(0))
+    digits = _NON_DIGIT_RE.sub("", match.group(0))
     if len(digits) <= 4:
         return "*" * len(digits)
     masked = "*" * (len(digits) - 4) + digits[-4:]
@@ -6,7 +6,7 @@ from typing import Dict, List, Optional
 
 from app.settings import settings
 
-from .anti_injection import cleanse_injection
+from .anti_injection import cleanse_injection, contains_injection
 from .diagnostics import build_diagnostics
 from .metrics import GuardrailMetricsStore
 from .moderation import moderate_text
@@ -119,8 +119,7 @@ class GuardrailsService:
             if text is None and isinstance(chunk, dict):
                 text = chunk.get("text", "")
             text = text or ""
-            _, detected, _ = cleanse_injection(text)
-            if detected:
+            if contains_injection(text):
                 self._metrics.increment("context_filtered_total")
                 continue
             filtered.append(chunk)
@@ -13,7 +13,8 @@ class ValidationError(HTTPException):
 
 
 def validate_payload(message: Optional[str], user_id: Optional[str], metadata: Optional[Dict[str, Any]]) -> None:
-    if not isinstance(message, str) or not message.strip():
+    # isspace() answers "blank?" without copying the message like strip() would
+    if not isinstance(message, str) or not message or message.isspace():
         raise ValidationError("Campo 'message' deve ser uma string nao vazia.")
 
     if len(message) > settings.guardrails_max_input_chars:
@@ -141,9 +141,19 @@ _KEYWORD_RULES: Tuple[KeywordRule, ...] = (
 CARD_NUMBER_RE = re.compile(r"\b(?:\d[ -]?){13,19}\b")
 SSN_RE = re.compile(r"\b\d{3}-\d{2}-\d{4}\b")
 
+# matches iff at least one keyword of any rule occurs in the lowered text
+_ANY_KEYWORD_RE = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in sorted({kw for rule in _KEYWORD_RULES for kw in rule.keywords if kw}, key=len, reverse=True)
+    )
+)
+
 
 def detect_keyword_violations(text: str) -> List[GuardrailViolation]:
     lowered = text.lower()
+    if not _ANY_KEYWORD_RE.search(lowered):
+        return []
     violations: List[GuardrailViolation] = []
     seen: Set[tuple[str, str]] = set()
     for rule in _KEYWORD_RULES:
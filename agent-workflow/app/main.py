@@ -8,6 +8,7 @@ from app.routers.chat import router as chat_router
 from app.routers.health import router as health_router
 from app.routers.router_agent import router as router_agent_router
 from app.routers.support_tickets import router as support_tickets_router
+from app.services.slack import close_slack_client
 from app.settings import settings
 from app.utils.text import strip_portuguese_accents
 
@@ -59,6 +60,8 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    app.add_event_handler("shutdown", close_slack_client)
+
     app.include_router(health_router)
     app.include_router(router_agent_router)
     app.include_router(chat_router)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, Tuple
 
 import importlib
@@ -43,7 +44,7 @@ class ReadinessChecker:
     def _check_embeddings_store(self) -> Tuple[bool, str | None]:
         if not settings.rag_enabled:
             return True, "rag_disabled"
-        if self._index_dir.exists() and any(self._index_dir.glob("index_*.jsonl")):
+        if _index_present(self._index_dir):
             return True, None
         return False, f"missing embeddings index at {self._index_dir}"
 
@@ -65,6 +66,10 @@ class ReadinessChecker:
         return False, "; ".join(part for part in detail_parts if part)
 
 
+def _index_present(index_dir: Path) -> bool:
+    return index_dir.exists() and any(index_dir.glob("index_*.jsonl"))
+
+
 def _cpu_usage_ok(limit_percent: int) -> Tuple[bool, str | None]:
     try:
         load1, _, _ = os.getloadavg()
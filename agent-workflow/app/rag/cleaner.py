@@ -10,8 +10,10 @@ from .loader import RawDocument
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
 
-@dataclass
+
+@dataclass(slots=True)
 class CleanDocument:
     url: str
     title: str | None
@@ -30,8 +32,8 @@ def clean_document(raw: RawDocument) -> CleanDocument:
         tag.decompose()
 
     main = soup.find("article") or soup.find("main") or soup.body
-    text = main.get_text(separator="\n") if main else soup.get_text(separator="\n")
-    text = _normalise(text)
+    # whitespace-only nodes are skipped here; _normalise collapses what is left
+    text = _normalise(" ".join((main or soup).stripped_strings))
 
     title = raw.title or (soup.title.string.strip() if soup.title and soup.title.string else None)
 
@@ -39,7 +41,5 @@ def clean_document(raw: RawDocument) -> CleanDocument:
 
 
 def _normalise(text: str) -> str:
-    text = text.replace("\r", "\n")
-    text = re.sub(r"\n{2,}", "\n", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    # every whitespace run, newlines included, collapses to one space in a single pass
+    return _WHITESPACE_RE.sub(" ", text).strip()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable
+
+from app.utils.jsonl import dumps_line
 
 from .splitter import Chunk
 
@@ -19,22 +21,30 @@ def build_index(chunks: Iterable[Chunk], *, index_dir: Path) -> IndexArtifact:
     index_path = index_dir / f"index_{timestamp}.jsonl"
     index_dir.mkdir(parents=True, exist_ok=True)
 
-    serialised: List[str] = []
-    for chunk in chunks:
-        serialised.append(
-            json.dumps(
-                {
-                    "id": chunk.id,
-                    "url": chunk.url,
-                    "title": chunk.title,
-                    "order": chunk.order,
-                    "text": chunk.text,
-                    "embedding": chunk.embedding,
-                    "content_hash": chunk.content_hash,
-                },
-                ensure_ascii=False,
-            )
-        )
-
-    index_path.write_text("\n".join(serialised), encoding="utf-8")
-    return IndexArtifact(path=index_path, count=len(serialised))
+    # lines are streamed to disk so peak memory is one chunk, not the whole index;
+    # the temp name does not match index_*.jsonl, so a partial write is never picked up
+    temp_path = index_path.with_suffix(".tmp")
+    count = 0
+    try:
+        with temp_path.open("wb") as handle:
+            for chunk in chunks:
+                handle.write(
+                    dumps_line(
+                        {
+                            "id": chunk.id,
+                            "url": chunk.url,
+                            "title": chunk.title,
+                            "order": chunk.order,
+                            "text": chunk.text,
+                            "embedding": chunk.embedding,
+                            "content_hash": chunk.content_hash,
+                        }
+                    )
+                )
+                count += 1
+        os.replace(temp_path, index_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    return IndexArtifact(path=index_path, count=count)
@@ -4,6 +4,7 @@ import logging
 import time
 import uuid
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Callable, List
 
 from .cleaner import CleanDocument, clean_document
@@ -25,6 +26,9 @@ class RAGResult:
     embedded_count: int
     index_count: int
     dry_run: bool
+    raw_path: Path | None = None
+    chunks_path: Path | None = None
+    manifest_path: Path | None = None
 
 
 class RAGRunner:
@@ -72,6 +76,7 @@ class RAGRunner:
         pre_embed_path = save_chunks(chunks, directory=self.config.paths.chunks_dir, stage="clean")
         logger.info("rag.runner.chunks_created", extra={"count": len(chunks), "path": str(pre_embed_path)})
 
+        chunks_path = pre_embed_path
         embedded_count = 0
         index_count = 0
         if not self.config.dry_run and chunks:
@@ -80,6 +85,7 @@ class RAGRunner:
             embedded_count = sum(1 for chunk in chunks if chunk.embedding)
             post_embed_path = save_chunks(chunks, directory=self.config.paths.chunks_dir, stage="embedded")
             logger.info("rag.runner.chunks_embedded", extra={"count": embedded_count, "path": str(post_embed_path)})
+            chunks_path = post_embed_path
 
             artifact = build_index(chunks, index_dir=self.config.paths.index_dir)
             index_count = artifact.count
@@ -114,6 +120,9 @@ class RAGRunner:
             embedded_count=embedded_count,
             index_count=index_count,
             dry_run=self.config.dry_run,
+            raw_path=raw_path,
+            chunks_path=chunks_path,
+            manifest_path=manifest_path,
         )
 
 
@@ -6,7 +6,7 @@ from typing import List
 from .cleaner import CleanDocument
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     id: str
     url: str
@@ -1,34 +1,58 @@
 from __future__ import annotations
 
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from itertools import islice
+from typing import Any, Optional
 
+_SWEEP_LIMIT = 32
 
-@dataclass
+
+@dataclass(slots=True)
 class CacheEntry:
     value: Any
     expires_at: float
 
 
 class QueryCache:
-    def __init__(self, ttl_seconds: int) -> None:
+    def __init__(self, ttl_seconds: int, max_entries: int = 1024) -> None:
         self._ttl = ttl_seconds
-        self._store: Dict[str, CacheEntry] = {}
+        self._max_entries = max_entries
+        # least recently used first, so eviction and the expiry sweep start at the front
+        self._store: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
 
     def get(self, key: str) -> Optional[Any]:
-        entry = self._store.get(key)
-        if not entry:
-            return None
-        if entry.expires_at < time.time():
-            self._store.pop(key, None)
-            return None
-        return entry.value
+        with self._lock:
+            entry = self._store.get(key)
+            if not entry:
+                return None
+            if entry.expires_at < time.time():
+                self._store.pop(key, None)
+                return None
+            self._store.move_to_end(key)
+            return entry.value
 
     def set(self, key: str, value: Any) -> None:
         if self._ttl <= 0:
             return
-        self._store[key] = CacheEntry(value=value, expires_at=time.time() + self._ttl)
+        now = time.time()
+        with self._lock:
+            store = self._store
+            store[key] = CacheEntry(value=value, expires_at=now + self._ttl)
+            store.move_to_end(key)
+            self._sweep_expired(now)
+            while len(store) > self._max_entries:
+                store.popitem(last=False)
 
     def clear(self) -> None:
-        self._store.clear()
+        with self._lock:
+            self._store.clear()
+
+    def _sweep_expired(self, now: float) -> None:
+        """Drop expired entries among the oldest few so dead keys do not pile up."""
+        for key in list(islice(self._store, _SWEEP_LIMIT)):
+            if self._store[key].expires_at < now:
+                del self._store[key]
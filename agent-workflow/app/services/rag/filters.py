@@ -14,12 +14,18 @@ INJECTION_PATTERNS = [
         r"reset the conversation",
     ]
 ]
+# one pass per chunk; only the yes/no answer is needed, so the patterns can share a single search
+_ANY_INJECTION_RE = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in INJECTION_PATTERNS),
+    re.IGNORECASE,
+)
+_NAVIGATION_KEYWORDS = ("menu", "cookies", "copyright", "termos de uso")
 
 
 def filter_chunks(chunks: Iterable[RetrievedChunk]) -> List[RetrievedChunk]:
     filtered: List[RetrievedChunk] = []
     for chunk in chunks:
-        if any(pattern.search(chunk.text) for pattern in INJECTION_PATTERNS):
+        if _ANY_INJECTION_RE.search(chunk.text):
             continue
         if _looks_like_navigation(chunk.text):
             continue
@@ -31,4 +37,4 @@ def _looks_like_navigation(text: str) -> bool:
     lowered = text.lower()
     if len(lowered.split()) <= 3:
         return True
-    return any(keyword in lowered for keyword in ["menu", "cookies", "copyright", "termos de uso"])
+    return any(keyword in lowered for keyword in _NAVIGATION_KEYWORDS)
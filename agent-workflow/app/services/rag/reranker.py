@@ -26,6 +26,12 @@ class HeuristicReranker:
         if not tokens:
             return list(chunks)
 
+        # padded once per query rather than once per chunk and token
+        padded_tokens = [f" {token} " for token in tokens]
+        title_boost = self.title_boost
+        exact_term_boost = self.exact_term_boost
+        length_penalty = self.length_penalty
+
         reranked: List[RetrievedChunk] = []
         for chunk in chunks:
             score = chunk.raw_score
@@ -33,13 +39,12 @@ class HeuristicReranker:
                 lowered_title = chunk.title.lower()
                 for token in tokens:
                     if token in lowered_title:
-                        score += self.title_boost
+                        score += title_boost
             lowered_text = chunk.text.lower()
-            for token in tokens:
-                if f" {token} " in lowered_text:
-                    score += self.exact_term_boost
-            length_factor = max(len(chunk.text), 1)
-            penalty = self.length_penalty * (abs(len(chunk.text) - 800) / 800)
+            for padded in padded_tokens:
+                if padded in lowered_text:
+                    score += exact_term_boost
+            penalty = length_penalty * (abs(len(chunk.text) - 800) / 800)
             score -= penalty
             chunk.rank_score = score
             reranked.append(chunk)
@@ -7,13 +7,16 @@ import re
 import unicodedata
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
 from app.settings import settings
 from app.utils.paths import get_rag_index_dir
 
 logger = logging.getLogger(__name__)
 
+# index dir -> ((file name, st_mtime_ns, st_size), ...), entries; lets every retriever share one parse
+_INDEX_CACHE: Dict[Path, Tuple[Tuple[Tuple[str, int, int], ...], List[dict]]] = {}
+
 
 @dataclass
 class RetrievedChunk:
@@ -89,6 +92,12 @@ class RAGRetriever:
             return self._index_cache
 
         index_files = sorted(self.index_dir.glob("index_*.jsonl"), reverse=True)
+        fingerprint = _fingerprint(index_files)
+        cached = _INDEX_CACHE.get(self.index_dir)
+        if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+            self._index_cache = cached[1]
+            return self._index_cache
+
         entries: List[dict] = []
         for file in index_files:
             try:
@@ -109,9 +118,19 @@ class RAGRetriever:
                 continue
 
         self._index_cache = entries
+        if fingerprint is not None:
+            _INDEX_CACHE[self.index_dir] = (fingerprint, entries)
         return self._index_cache
 
 
+def _fingerprint(index_files: List[Path]) -> Tuple[Tuple[str, int, int], ...] | None:
+    try:
+        stats = [(file.name, file.stat()) for file in index_files]
+    except OSError:
+        return None
+    return tuple((name, stat.st_mtime_ns, stat.st_size) for name, stat in stats)
+
+
 def _normalise_query(query: str) -> str:
     query = query.lower().strip()
     query = re.sub(r"\s+", " ", query)
@@ -1,4 +1,4 @@
-﻿from .client import SlackClient, SlackPayload, SlackResult, get_slack_client
+﻿from .client import SlackClient, SlackPayload, SlackResult, close_slack_client, get_slack_client
 from .payloads import SlackContext, SlackMessage, build_slack_message
 
 __all__ = [
@@ -8,5 +8,6 @@ __all__ = [
     "SlackContext",
     "SlackMessage",
     "build_slack_message",
+    "close_slack_client",
     "get_slack_client",
 ]
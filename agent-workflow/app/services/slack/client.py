@@ -1,8 +1,11 @@
 ﻿from __future__ import annotations
 
 import logging
+import random
+import threading
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Protocol
 
 import httpx
@@ -38,6 +41,9 @@ class SlackClient(Protocol):
     def send_message(self, payload: SlackPayload) -> SlackResult:
         ...
 
+    def close(self) -> None:
+        ...
+
 
 class MockSlackClient:
     def send_message(self, payload: SlackPayload) -> SlackResult:  # type: ignore[override]
@@ -48,30 +54,111 @@ class MockSlackClient:
         )
         return SlackResult(ok=True, message_id=message_id, channel=payload.channel)
 
+    def close(self) -> None:
+        return None
+
+
+_BACKOFF_BASE_SECONDS = 0.25
+_BACKOFF_MAX_SECONDS = 8.0
+_BACKOFF_JITTER = 0.1
+
+
+def _is_retryable_status(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
+def _backoff_delay(attempt: int) -> float:
+    delay = min(_BACKOFF_MAX_SECONDS, _BACKOFF_BASE_SECONDS * (2**attempt))
+    return delay * (1 + random.uniform(-_BACKOFF_JITTER, _BACKOFF_JITTER))
+
+
+class CircuitBreaker:
+    """Short-circuits Slack calls for ``reset_seconds`` after repeated failures."""
+
+    def __init__(self, *, failure_threshold: int, reset_seconds: float) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def can_execute(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            # half-open: let a single probe through once the cool-down elapsed
+            if time.monotonic() - self._opened_at >= self._reset_seconds:
+                self._opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self._failure_threshold:
+                self._opened_at = time.monotonic()
+
 
 class RealSlackClient:
-    def __init__(self, *, webhook_url: Optional[str], bot_token: Optional[str], timeout: float, retries: int) -> None:
+    def __init__(
+        self,
+        *,
+        webhook_url: Optional[str],
+        bot_token: Optional[str],
+        timeout: float,
+        retries: int,
+        breaker: Optional[CircuitBreaker] = None,
+        http_client: Optional[httpx.Client] = None,
+    ) -> None:
         self._webhook_url = webhook_url
         self._bot_token = bot_token
         self._timeout = timeout
         self._retries = retries
+        # a long-lived client keeps the TLS connection to Slack alive between sends;
+        # only a client created here is closed by close()
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.Client(timeout=timeout)
+        self._breaker = breaker or CircuitBreaker(
+            failure_threshold=settings.slack_circuit_failure_threshold,
+            reset_seconds=settings.slack_circuit_reset_seconds,
+        )
+
+    def close(self) -> None:
+        if self._owns_http:
+            self._http.close()
 
     def send_message(self, payload: SlackPayload) -> SlackResult:  # type: ignore[override]
         if not self._webhook_url and not self._bot_token:
             return SlackResult(ok=False, message_id=None, channel=payload.channel, error="slack_credentials_missing")
+        if not self._breaker.can_execute():
+            logger.warning(
+                "slack.real.circuit_open",
+                extra={"channel": payload.channel},
+            )
+            return SlackResult(ok=False, message_id=None, channel=payload.channel, error="circuit_open")
 
         data = payload.as_dict()
         error: Optional[str] = None
         for attempt in range(self._retries + 1):
+            retryable = True
             try:
                 if self._webhook_url:
-                    response = httpx.post(
+                    response = self._http.post(
                         self._webhook_url,
                         json=data,
                         timeout=self._timeout,
                     )
                 else:
-                    response = httpx.post(
+                    response = self._http.post(
                         "https://slack.com/api/chat.postMessage",
                         headers={
                             "Authorization": f"Bearer {self._bot_token}",
@@ -87,15 +174,31 @@ class RealSlackClient:
             else:
                 if response.status_code >= 400:
                     error = f"http_{response.status_code}"
+                    retryable = _is_retryable_status(response.status_code)
+                elif self._webhook_url:
+                    # incoming webhooks answer with a plain-text "ok" body, never JSON
+                    self._breaker.record_success()
+                    message_id = response.headers.get("X-Slack-Req-Id") or f"real-{int(time.time() * 1000)}"
+                    return SlackResult(ok=True, message_id=message_id, channel=data["channel"])
                 else:
+                    # a 2xx answer without a JSON body is taken as delivered
                     payload_json = response.json() if "application/json" in response.headers.get("Content-Type", "") else {}
                     if payload_json.get("ok", True):
                         message_id = payload_json.get("ts") or payload_json.get("message", {}).get("ts")
                         if not message_id:
                             message_id = response.headers.get("X-Slack-Req-Id") or f"real-{int(time.time() * 1000)}"
+                        self._breaker.record_success()
                         return SlackResult(ok=True, message_id=message_id, channel=data["channel"])
                     error = payload_json.get("error", "unknown_error")
-            time.sleep(0.5 * (attempt + 1))
+                    retryable = error == "ratelimited"
+            if not retryable or attempt >= self._retries:
+                break
+            time.sleep(_backoff_delay(attempt))
+        if retryable:
+            self._breaker.record_failure()
+        else:
+            # a rejected request (bad channel, 404, ...) means Slack itself is up
+            self._breaker.record_success()
         logger.error(
             "slack.real.send_failed",
             extra={"channel": payload.channel, "error": error},
@@ -103,19 +206,20 @@ class RealSlackClient:
         return SlackResult(ok=False, message_id=None, channel=payload.channel, error=error)
 
 
-_client: Optional[SlackClient] = None
+@lru_cache(maxsize=1)
+def get_slack_client() -> SlackClient:
+    if settings.slack_enabled and settings.slack_mode == "real":
+        return RealSlackClient(
+            webhook_url=settings.slack_webhook_url,
+            bot_token=settings.slack_bot_token,
+            timeout=settings.slack_timeout_seconds,
+            retries=max(0, settings.slack_max_retries),
+        )
+    return MockSlackClient()
 
 
-def get_slack_client() -> SlackClient:
-    global _client
-    if _client is None:
-        if settings.slack_enabled and settings.slack_mode == "real":
-            _client = RealSlackClient(
-                webhook_url=settings.slack_webhook_url,
-                bot_token=settings.slack_bot_token,
-                timeout=settings.slack_timeout_seconds,
-                retries=max(0, settings.slack_max_retries),
-            )
-        else:
-            _client = MockSlackClient()
-    return _client
+def close_slack_client() -> None:
+    """Release the shared client's connections, if one was ever created."""
+    if get_slack_client.cache_info().currsize:
+        get_slack_client().close()
+        get_slack_client.cache_clear()
@@ -9,6 +9,9 @@ from app.settings import settings
 _EMAIL_RE = re.compile(r"([\w._%+-]+)@([\w.-]+)")
 _PHONE_RE = re.compile(r"\b\+?\d[\d\-\s]{7,}\b")
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
+_LONG_DIGITS_RE = re.compile(r"\b\d{11,}\b")
+_URL_RE = re.compile(r"https?://\S+")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 @dataclass
@@ -38,12 +41,12 @@ def _truncate(text: str, limit: int) -> str:
     return text
 
 
-def _mask_pii(text: str) -> str:
-    if not text or not settings.pii_masking_enabled:
+def _mask_pii(text: str, enabled: bool) -> str:
+    if not text or not enabled:
         return text or ""
     masked = _EMAIL_RE.sub(r"***@\2", text)
     masked = _PHONE_RE.sub("***", masked)
-    masked = re.sub(r"\b\d{11,}\b", "***", masked)
+    masked = _LONG_DIGITS_RE.sub("***", masked)
     return masked
 
 
@@ -51,23 +54,26 @@ def _sanitize(text: str) -> str:
     if not text:
         return ""
     clean = _HTML_TAG_RE.sub(" ", text)
-    clean = re.sub(r"https?://\S+", "[link]", clean)
-    clean = re.sub(r"\s+", " ", clean)
+    clean = _URL_RE.sub("[link]", clean)
+    clean = _WHITESPACE_RE.sub(" ", clean)
     return clean.strip()
 
 
 def build_slack_message(context: SlackContext) -> SlackMessage:
     summary_limit = settings.handoff_summary_max_chars
     details_limit = settings.handoff_details_max_chars
+    mask = settings.pii_masking_enabled
 
-    summary = _sanitize(_mask_pii(context.summary))
-    details = _sanitize(_mask_pii(context.details))
+    summary = _sanitize(_mask_pii(context.summary, mask))
+    details = _sanitize(_mask_pii(context.details, mask))
     summary = _truncate(summary, summary_limit)
     details = _truncate(details, details_limit)
 
-    title = _truncate(_sanitize(_mask_pii(context.title)), 120)
+    title = _truncate(_sanitize(_mask_pii(context.title, mask)), 120)
+    links = context.links[:3] if context.links else []
 
-    lines = [f"*{title}*", summary]
+    header = f"*{title}*"
+    lines = [header, summary]
     if details:
         lines.append(details)
 
@@ -80,9 +86,7 @@ def build_slack_message(context: SlackContext) -> SlackMessage:
         lines.append(f"Clas.: {badge}")
     if context.requested_by:
         lines.append(f"Solicitado por: {context.requested_by}")
-    if context.links:
-        for link in context.links[:3]:
-            lines.append(f"Link: {link}")
+    lines.extend([f"Link: {link}" for link in links])
     lines.append(f"Correlation: {context.correlation_id}")
 
     text = "\n".join(lines)
@@ -90,7 +94,7 @@ def build_slack_message(context: SlackContext) -> SlackMessage:
     blocks: List[dict] = [
         {
             "type": "section",
-            "text": {"type": "mrkdwn", "text": f"*{title}*"},
+            "text": {"type": "mrkdwn", "text": header},
         },
         {
             "type": "section",
@@ -118,8 +122,8 @@ def build_slack_message(context: SlackContext) -> SlackMessage:
                 ],
             }
         )
-    if context.links:
-        link_text = " | ".join(context.links[:3])
+    if links:
+        link_text = " | ".join(links)
         blocks.append(
             {
                 "type": "context",
@@ -1,11 +1,13 @@
 ﻿from __future__ import annotations
 
 import logging
+import math
 import re
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from statistics import mean
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Deque, Dict, Optional
 
 from app.agents.support_policies import PolicyDecision, decide
 from app.settings import settings
@@ -25,39 +27,71 @@ from app.tools.support import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SupportMetrics:
     total_requests: int = 0
     faq_hits: int = 0
     tickets_created: int = 0
     escalations: int = 0
-    latencies_ms: list[float] = field(default_factory=list)
     max_samples: int = 2000
+    # bounded ring buffer: appending past max_samples drops the oldest value in O(1)
+    _latencies: Deque[float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._latencies = deque(maxlen=self.max_samples)
 
     def add_latency(self, value: float) -> None:
-        self.latencies_ms.append(value)
-        if len(self.latencies_ms) > self.max_samples:
-            self.latencies_ms.pop(0)
+        self._latencies.append(value)
+
+    @property
+    def latencies_ms(self) -> list[float]:
+        return list(self._latencies)
 
     @property
     def average_latency_ms(self) -> float:
-        return round(mean(self.latencies_ms), 2) if self.latencies_ms else 0.0
+        if not self._latencies:
+            return 0.0
+        # fsum is exactly rounded like statistics.mean, without its Fraction arithmetic
+        return round(math.fsum(self._latencies) / len(self._latencies), 2)
 
     @property
     def p95_latency_ms(self) -> float:
-        if not self.latencies_ms:
+        if not self._latencies:
             return 0.0
-        sorted_values = sorted(self.latencies_ms)
+        sorted_values = sorted(self._latencies)
         index = max(0, int(len(sorted_values) * 0.95) - 1)
         return round(sorted_values[index], 2)
 
 
+# one alternation per pass; _mask_match dispatches on the group that matched
+_PII_RE = re.compile(
+    r"(?P<local>[\w._%+-]+)@(?P<domain>[\w.-]+)"
+    r"|\b(?P<head>\d{2})\d{3}(?P<tail>\d{2,})\b"
+    r"|\b\d{5,}\b"
+)
+_DIGITS_RE = re.compile(r"\b(?P<head>\d{2})\d{3}(?P<tail>\d{2,})\b|\b\d{5,}\b")
+_PII_CANDIDATE = frozenset("0123456789@")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _mask_match(match: re.Match[str]) -> str:
+    group = match.lastgroup
+    if group == "domain":
+        return "***@" + _DIGITS_RE.sub(_mask_match, match.group("domain"))
+    if group == "tail":
+        tail = match.group("tail")
+        # a long tail is itself a run of 5+ digits and is redacted too
+        return match.group("head") + ("******" if len(tail) >= 5 else "***" + tail)
+    return "***"
+
+
 def _mask_pii(value: Optional[str]) -> Optional[str]:
     if not value or not settings.support_pii_masking_enabled:
         return value
-    masked = re.sub(r"([\w._%+-]+)@([\w.-]+)", r"***@\2", value)
-    masked = re.sub(r"\b(\d{2})\d{3}(\d{2,})\b", r"\1***\2", masked)
-    masked = re.sub(r"\b\d{5,}\b", "***", masked)
+    if _PII_CANDIDATE.isdisjoint(value):
+        # none of the patterns can match, so the value is fully redacted as below
+        return "***"
+    masked = _PII_RE.sub(_mask_match, value)
     if masked == value:
         return "***"
     return masked
@@ -79,7 +113,7 @@ class SupportService:
         self.metrics = SupportMetrics()
 
     def handle_support(self, message: str, user_id: Optional[str], correlation_id: str) -> Dict[str, object]:
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         self.metrics.total_requests += 1
         masked_user = _mask_pii(user_id)
         tools_used: list[str] = []
@@ -90,14 +124,14 @@ class SupportService:
         if profile:
             tools_used.append("user_profile")
         profile_masked = self._profile_tool.snapshot(profile)
-        updated_fields = sorted(profile_updates.keys())
+        updated_fields = tuple(profile_updates)
         if updated_fields:
             logger.info(
                 "support.profile.updated",
                 extra={
                     "correlation_id": correlation_id,
                     "user_id": masked_user,
-                    "fields": updated_fields,
+                    "fields": sorted(updated_fields),
                 },
             )
 
@@ -189,6 +223,8 @@ class SupportService:
         }
 
     def get_ticket_public(self, ticket_id: str) -> Optional[TicketPublicView]:
+        # user refs are usually opaque ids without digits or "@", which
+        # _mask_pii redacts without running the regex pipeline
         ticket = self._ticket_tool.get(ticket_id)
         if not ticket:
             return None
@@ -250,8 +286,8 @@ class SupportService:
         )
 
 
-def _elapsed_ms(start: float) -> float:
-    return round((time.perf_counter() - start) * 1000, 2)
+def _elapsed_ms(start: int) -> float:
+    return round((time.perf_counter_ns() - start) / 1_000_000, 2)
 
 
 def _build_summary(message: str) -> str:
@@ -263,18 +299,13 @@ def _build_summary(message: str) -> str:
 
 def _normalise_description(message: str) -> str:
     text = (message or "").strip()
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     limit = settings.support_max_response_chars
     if limit and len(text) > limit:
         text = text[:limit]
     return text
 
 
-_support_service: Optional[SupportService] = None
-
-
+@lru_cache(maxsize=1)
 def get_support_service() -> SupportService:
-    global _support_service
-    if _support_service is None:
-        _support_service = SupportService()
-    return _support_service
+    return SupportService()
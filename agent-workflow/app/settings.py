@@ -56,6 +56,8 @@ class Settings(BaseSettings):
     slack_default_channel: str = "#support-escalations"
     slack_timeout_seconds: float = 10.0
     slack_max_retries: int = 2
+    slack_circuit_failure_threshold: int = 5
+    slack_circuit_reset_seconds: float = 30.0
 
     redirect_enabled: bool = True
     redirect_confidence_threshold: float = 0.3
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
-from app.settings import settings
-from app.utils.text import strip_portuguese_accents
+from app.utils.text import strip_accents_and_lower
 from app.utils.paths import get_support_data_dir
 
 
@@ -24,7 +25,7 @@ class AccountStatusRecord:
     def from_dict(cls, payload: Dict[str, object]) -> "AccountStatusRecord":
         return cls(
             id=str(payload["id"]),
-            triggers=[strip_portuguese_accents(str(item).lower()) for item in payload.get("triggers", [])],
+            triggers=[_normalise(str(item)) for item in payload.get("triggers", [])],
             status=str(payload.get("status", "unknown")),
             reason=str(payload.get("reason", "")),
             limit=payload.get("limit"),
@@ -55,6 +56,7 @@ class AccountStatusTool:
         default_path = get_support_data_dir() / "account_status.json"
         self._dataset_path = dataset_path or default_path
         self._records: List[AccountStatusRecord] = []
+        self._trigger_pattern: Optional[re.Pattern[str]] = None
         self._load_records()
 
     def _load_records(self) -> None:
@@ -71,20 +73,38 @@ class AccountStatusTool:
             except Exception:
                 continue
             self._records.append(record)
+        self._build_trigger_pattern()
+
+    def _build_trigger_pattern(self) -> None:
+        # The alternation only answers "does any trigger occur?", so messages
+        # without a trigger are rejected in a single scan. Matches still go
+        # through the ordered loop because the first trigger in dataset order
+        # wins, not the leftmost one in the message.
+        triggers = {trigger for record in self._records for trigger in record.triggers if trigger}
+        if not triggers:
+            self._trigger_pattern = None
+            return
+        alternatives = sorted(triggers, key=len, reverse=True)
+        self._trigger_pattern = re.compile("|".join(re.escape(trigger) for trigger in alternatives))
 
     def lookup(self, message: str, *, user_id: Optional[str] = None, profile: Optional[object] = None) -> Optional[AccountStatusResult]:
         if not message:
             return None
-        if not settings.support_pii_masking_enabled:
-            # even when masking is disabled, we still normalise accents for matching
-            normalised = strip_portuguese_accents(message.lower())
-        else:
-            normalised = strip_portuguese_accents(message.lower())
+        if self._trigger_pattern is None:
+            return None
+        normalised = _normalise(message)
+        if not self._trigger_pattern.search(normalised):
+            return None
         for record in self._records:
             for trigger in record.triggers:
                 if trigger and trigger in normalised:
                     return AccountStatusResult(record=record, matched_trigger=trigger)
-        return None
+        return None  # pragma: no cover - the prefilter only passes messages containing a trigger
 
     def available_records(self) -> Iterable[AccountStatusRecord]:
         return tuple(self._records)
+
+
+@lru_cache(maxsize=1024)
+def _normalise(message: str) -> str:
+    return strip_accents_and_lower(message)
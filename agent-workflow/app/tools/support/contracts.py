@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class FAQItem:
     id: str
     pergunta: str
@@ -15,19 +15,20 @@ class FAQItem:
     atualizado_em: str
 
 
-@dataclass
+# frozen: FAQTool hands the same cached instance to every caller with an equal query
+@dataclass(slots=True, frozen=True)
 class FAQResult:
     item: FAQItem
     score: float
     explanation: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FAQQuery:
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketCreateRequest:
     summary: str
     description: str
@@ -39,7 +40,7 @@ class TicketCreateRequest:
     profile_snapshot: Optional[Dict[str, Optional[str]]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Ticket:
     id: str
     summary: str
@@ -56,7 +57,7 @@ class Ticket:
     profile_snapshot: Optional[Dict[str, Optional[str]]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketPublicView:
     id: str
     status: str
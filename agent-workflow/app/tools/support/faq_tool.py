@@ -3,60 +3,203 @@ from __future__ import annotations
 import json
 import logging
 import re
+import sys
+import threading
 import unicodedata
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 
 from app.settings import settings
 from app.utils.paths import get_support_data_dir
+from app.utils.text import strip_accents_and_lower
 
 from .contracts import FAQItem, FAQQuery, FAQResult
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _IndexedFAQItem:
+    """FAQ item with the text fields normalised once at load time."""
+
+    item: FAQItem
+    pergunta: str
+    resposta: str
+    tags: FrozenSet[str]
+
+    @classmethod
+    def from_item(cls, item: FAQItem) -> "_IndexedFAQItem":
+        return cls(
+            item=item,
+            pergunta=_normalise(item.pergunta),
+            resposta=_normalise(item.resposta),
+            tags=frozenset(item.tags),
+        )
+
+
+@dataclass(frozen=True)
+class _FAQIndex:
+    """Read-only search structures for one version of the FAQ dataset.
+
+    Word postings keep the (pergunta, resposta) term frequencies so that
+    substring matches can be recovered exactly at query time. The
+    vocabulary is also kept as one newline-joined string so a token can be
+    located in every word with ``str.find`` instead of a Python loop.
+    """
+
+    items: Tuple[_IndexedFAQItem, ...]
+    postings: Dict[str, Dict[int, Tuple[int, int]]]
+    tag_postings: Dict[str, Tuple[int, ...]]
+    vocabulary: Tuple[str, ...]
+    vocabulary_text: str
+    vocabulary_offsets: Tuple[int, ...]
+
+    @classmethod
+    def build(cls, items: Sequence[_IndexedFAQItem]) -> "_FAQIndex":
+        postings: Dict[str, Dict[int, Tuple[int, int]]] = {}
+        tag_postings: Dict[str, List[int]] = {}
+        for index, entry in enumerate(items):
+            if not entry.pergunta and not entry.resposta:
+                continue
+            for field_position, text in enumerate((entry.pergunta, entry.resposta)):
+                for word in text.split():
+                    counts = postings.setdefault(sys.intern(word), {})
+                    pergunta_count, resposta_count = counts.get(index, (0, 0))
+                    if field_position == 0:
+                        pergunta_count += 1
+                    else:
+                        resposta_count += 1
+                    counts[index] = (pergunta_count, resposta_count)
+            for tag in entry.tags:
+                tag_postings.setdefault(tag, []).append(index)
+
+        vocabulary = tuple(postings)
+        offsets: List[int] = []
+        position = 0
+        for word in vocabulary:
+            offsets.append(position)
+            position += len(word) + 1
+        return cls(
+            items=tuple(items),
+            postings=postings,
+            tag_postings={tag: tuple(indexes) for tag, indexes in tag_postings.items()},
+            vocabulary=vocabulary,
+            vocabulary_text="\n".join(vocabulary),
+            vocabulary_offsets=tuple(offsets),
+        )
+
+    def occurrences(self, token: str) -> Dict[int, Tuple[int, int]]:
+        """Return per-item (pergunta, resposta) substring counts for ``token``.
+
+        Tokens never contain spaces, so counting inside each indexed word is
+        equivalent to ``str.count`` over the whole normalised field.
+        """
+        occurrences: Dict[int, Tuple[int, int]] = {}
+        text = self.vocabulary_text
+        position = text.find(token)
+        while position != -1:
+            word = self.vocabulary[bisect_right(self.vocabulary_offsets, position) - 1]
+            for index, (pergunta_count, resposta_count) in self.postings[word].items():
+                previous = occurrences.get(index, (0, 0))
+                occurrences[index] = (previous[0] + pergunta_count, previous[1] + resposta_count)
+            position = text.find(token, position + len(token))
+        return occurrences
+
+
+_EMPTY_INDEX = _FAQIndex.build(())
+_SEARCH_CACHE_SIZE = 256
+# dataset path -> (st_mtime_ns, st_size, index); lets every FAQTool share one parse
+_INDEX_CACHE: Dict[Path, Tuple[int, int, _FAQIndex]] = {}
+
+
 class FAQTool:
     def __init__(self, *, dataset_path: Optional[Path] = None) -> None:
         self._dataset_path = dataset_path or get_support_data_dir() / "faq.json"
-        self._items: List[FAQItem] = []
-        self._load_dataset()
+        self._index = _EMPTY_INDEX
+        # (normalised message, threshold) -> result, least recently used first; replaced on every load
+        self._search_cache: "OrderedDict[Tuple[str, float], Optional[FAQResult]]" = OrderedDict()
+        self._search_lock = threading.Lock()
+        # the dataset is read on first search so unused instances cost nothing
+        self._loaded = False
+        self._load_lock = threading.Lock()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self._load_dataset()
+                self._loaded = True
 
     def _load_dataset(self) -> None:
+        self._search_cache = OrderedDict()
         try:
-            raw = self._dataset_path.read_text(encoding="utf-8-sig")
+            stat = self._dataset_path.stat()
         except FileNotFoundError:
             logger.warning(
                 "support.faq.dataset_missing",
                 extra={"path": str(self._dataset_path)},
             )
-            self._items = []
+            self._index = _EMPTY_INDEX
             return
         except OSError as exc:
             logger.error(
                 "support.faq.dataset_unreadable",
                 extra={"path": str(self._dataset_path), "error": str(exc)},
             )
-            self._items = []
+            self._index = _EMPTY_INDEX
+            return
+
+        cached = _INDEX_CACHE.get(self._dataset_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            self._index = cached[2]
+            return
+
+        items = self._read_items()
+        if items is None:
+            self._index = _EMPTY_INDEX
             return
+        self._index = _FAQIndex.build(items)
+        _INDEX_CACHE[self._dataset_path] = (stat.st_mtime_ns, stat.st_size, self._index)
+
+    def _read_items(self) -> Optional[List[_IndexedFAQItem]]:
+        try:
+            # json.loads detects the encoding (and a UTF-8 BOM) straight from bytes
+            raw = self._dataset_path.read_bytes()
+        except FileNotFoundError:
+            logger.warning(
+                "support.faq.dataset_missing",
+                extra={"path": str(self._dataset_path)},
+            )
+            return None
+        except OSError as exc:
+            logger.error(
+                "support.faq.dataset_unreadable",
+                extra={"path": str(self._dataset_path), "error": str(exc)},
+            )
+            return None
 
         try:
             payload = json.loads(raw)
-        except json.JSONDecodeError as exc:
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
             logger.error(
                 "support.faq.dataset_invalid",
                 extra={"path": str(self._dataset_path), "error": str(exc)},
             )
-            self._items = []
-            return
+            return None
 
-        items: List[FAQItem] = []
+        items: List[_IndexedFAQItem] = []
         for entry in payload:
             try:
                 item = FAQItem(
                     id=str(entry.get("id", "")),
                     pergunta=str(entry.get("pergunta", "")),
                     resposta=str(entry.get("resposta", "")),
-                    tags=[str(tag).strip().lower() for tag in entry.get("tags", []) if str(tag).strip()],
+                    tags=[sys.intern(str(tag).strip().lower()) for tag in entry.get("tags", []) if str(tag).strip()],
                     categoria=str(entry.get("categoria", "outros")),
                     atualizado_em=str(entry.get("atualizado_em", "")),
                 )
@@ -66,79 +209,97 @@ class FAQTool:
                     extra={"path": str(self._dataset_path), "error": str(exc)},
                 )
                 continue
-            items.append(item)
-        self._items = items
+            items.append(_IndexedFAQItem.from_item(item))
+        return items
 
     def reload(self) -> None:
-        self._load_dataset()
+        self._loaded = False
 
     def search(self, query: FAQQuery) -> Optional[FAQResult]:
-        if not self._items:
+        self._ensure_loaded()
+        index = self._index
+        if not index.items:
             return None
 
         message = _normalise(query.message)
+        threshold = settings.support_faq_score_threshold
+        key = (message, threshold)
+        cache = self._search_cache
+        with self._search_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        result = self._search(index, message, threshold)
+        with self._search_lock:
+            cache[key] = result
+            if len(cache) > _SEARCH_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+
+    def _search(self, index: _FAQIndex, message: str, threshold: float) -> Optional[FAQResult]:
         tokens = [token for token in message.split() if len(token) > 1]
         if not tokens:
             return None
 
+        # repeated tokens still weigh once per occurrence, but are only looked up once
+        token_counts = Counter(tokens)
+        totals: Dict[int, float] = {}
+        matched: Dict[int, int] = {}
+        # tokens found in an item's pergunta or tags, reported in the explanation
+        explained: Dict[int, Set[str]] = {}
+        for token, repeats in token_counts.items():
+            touched = set()
+            for position, (pergunta_count, resposta_count) in index.occurrences(token).items():
+                totals[position] = totals.get(position, 0.0) + (pergunta_count * 0.6 + resposta_count * 0.4) * repeats
+                touched.add(position)
+                if pergunta_count:
+                    explained.setdefault(position, set()).add(token)
+            for position in index.tag_postings.get(token, ()):
+                totals[position] = totals.get(position, 0.0) + 1.0 * repeats
+                touched.add(position)
+                explained.setdefault(position, set()).add(token)
+            for position in touched:
+                matched[position] = matched.get(position, 0) + repeats
+
         best_result: Optional[FAQResult] = None
-        threshold = settings.support_faq_score_threshold
 
-        for item in self._items:
-            score = _score_item(item, tokens)
+        for position in sorted(totals):
+            score = _score_item(totals[position], matched[position], len(tokens))
             if score < threshold:
                 continue
-            explanation = _build_explanation(item, tokens, score)
-            result = FAQResult(item=item, score=round(score, 3), explanation=explanation)
+            hits = explained.get(position, ())
+            explanation = _build_explanation([token for token in tokens if token in hits], score)
+            result = FAQResult(item=index.items[position].item, score=round(score, 3), explanation=explanation)
             if best_result is None or result.score > best_result.score:
                 best_result = result
+                if result.score >= 1.0:
+                    # scores are capped at 1.0 and ties keep the earlier item
+                    break
 
         return best_result
 
 
-_WORD_RE = re.compile(r"[^a-z0-9 ]+")
+_NONWORD_RE = re.compile(r"[^a-z0-9]+")
 
 
+@lru_cache(maxsize=1024)
 def _normalise(text: str) -> str:
-    text = text or ""
-    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
-    text = text.lower()
-    text = _WORD_RE.sub(" ", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
-
-
-def _score_item(item: FAQItem, tokens: List[str]) -> float:
-    pergunta = _normalise(item.pergunta)
-    resposta = _normalise(item.resposta)
-    tags = item.tags
-    if not pergunta and not resposta:
-        return 0.0
+    text = strip_accents_and_lower(text or "")
+    if not text.isascii():
+        # rare non-Portuguese characters still go through the full decomposition
+        text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+    return _NONWORD_RE.sub(" ", text).strip()
 
-    total = 0.0
-    matched_tokens = 0
-    for token in tokens:
-        token_matched = False
-        occurrences = pergunta.count(token) * 0.6 + resposta.count(token) * 0.4
-        if occurrences:
-            total += occurrences
-            token_matched = True
-        if token in tags:
-            total += 1.0
-            token_matched = True
-        if token_matched:
-            matched_tokens += 1
 
+def _score_item(total: float, matched_tokens: int, token_count: int) -> float:
     if total <= 0:
         return 0.0
 
-    max_candidates = [len(tokens), matched_tokens if matched_tokens else 1]
+    max_candidates = [token_count, matched_tokens if matched_tokens else 1]
     max_score = max(max_candidates) * 1.5
     total = min(total, max_score)
     return max(0.0, min(total / max_score, 1.0))
 
 
-def _build_explanation(item: FAQItem, tokens: List[str], score: float) -> str:
-    pergunta = _normalise(item.pergunta)
-    matched_tokens = [token for token in tokens if token in pergunta or token in item.tags]
+def _build_explanation(matched_tokens: List[str], score: float) -> str:
     return f"tokens={','.join(matched_tokens)} score={score:.2f}"
@@ -4,11 +4,12 @@ import json
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
 from app.settings import settings
-from app.utils.text import strip_portuguese_accents
+from app.utils.text import strip_accents_and_lower, strip_portuguese_accents
 from app.utils.paths import get_support_data_dir
 
 _EMAIL_PATTERN = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
@@ -24,9 +25,11 @@ _PLAN_PATTERNS: Dict[str, str] = {
     "free plan": "gratis",
     "enterprise": "enterprise",
 }
+# keys are accent-folded so "plano grátis" can match the normalised message
+_PLAN_LABELS: Dict[str, str] = {strip_portuguese_accents(pattern): label for pattern, label in _PLAN_PATTERNS.items()}
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     user_id: str
     email: Optional[str] = None
@@ -34,16 +37,21 @@ class UserProfile:
     last_updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def as_masked_dict(self) -> Dict[str, Optional[str]]:
+        enabled = settings.support_pii_masking_enabled
         return {
-            "user_id": mask_email(self.user_id),
-            "email": mask_email(self.email),
+            "user_id": _mask_email(self.user_id, enabled),
+            "email": _mask_email(self.email, enabled),
             "plan": self.plan,
             "last_updated": self.last_updated.isoformat(),
         }
 
 
 def mask_email(value: Optional[str]) -> Optional[str]:
-    if not value or not settings.support_pii_masking_enabled:
+    return _mask_email(value, settings.support_pii_masking_enabled)
+
+
+def _mask_email(value: Optional[str], enabled: bool) -> Optional[str]:
+    if not value or not enabled:
         return value
     username, _, domain = value.partition("@")
     if not username or not domain:
@@ -63,52 +71,90 @@ class UserProfileTool:
         file_path: Optional[Path] = None,
     ) -> None:
         self._persist = settings.support_tickets_persist_to_file if persist_to_file is None else persist_to_file
-        default_path = get_support_data_dir() / "user_profiles.json"
+        default_path = get_support_data_dir() / "user_profiles.jsonl"
         self._file_path = default_path if file_path is None else file_path
         self._profiles: Dict[str, UserProfile] = {}
+        self._log_lines = 0
         if self._persist:
             self._load()
 
     def _load(self) -> None:
+        """Replay the append-only profile log; later lines win."""
         if not self._file_path.exists():
+            self._import_legacy_file()
+            return
+        try:
+            with self._file_path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    self._log_lines += 1
+                    try:
+                        profile = _profile_from_record(json.loads(line))
+                    except (json.JSONDecodeError, KeyError, ValueError, TypeError):
+                        continue
+                    self._profiles[profile.user_id] = profile
+        except OSError:
+            return
+
+    def _import_legacy_file(self) -> None:
+        """Seed the log from the JSON array store used before the log format.
+
+        The legacy file is left in place; once the log exists it is no longer read.
+        """
+        legacy_path = self._file_path.with_suffix(".json")
+        if legacy_path == self._file_path or not legacy_path.exists():
             return
         try:
-            payload = json.loads(self._file_path.read_text(encoding="utf-8"))
+            payload = json.loads(legacy_path.read_text(encoding="utf-8-sig"))
         except (OSError, json.JSONDecodeError):
             return
         for record in payload:
             try:
-                profile = UserProfile(
-                    user_id=str(record["user_id"]),
-                    email=record.get("email"),
-                    plan=record.get("plan"),
-                    last_updated=datetime.fromisoformat(record["last_updated"]),
-                )
+                profile = _profile_from_record(record)
             except (KeyError, ValueError, TypeError):
                 continue
             self._profiles[profile.user_id] = profile
+        if self._profiles:
+            try:
+                self._rewrite_log()
+            except OSError:
+                return
 
-    def _persist_profiles(self) -> None:
+    def _persist_profile(self, profile: UserProfile) -> None:
         if not self._persist:
             return
-        data = [
-            {
-                "user_id": profile.user_id,
-                "email": profile.email,
-                "plan": profile.plan,
-                "last_updated": profile.last_updated.isoformat(),
-            }
-            for profile in self._profiles.values()
-        ]
         self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        # binary append: one encode and no TextIOWrapper per update
+        with self._file_path.open("ab") as handle:
+            handle.write((_serialise_profile(profile) + "\n").encode("utf-8"))
+        self._log_lines += 1
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Rewrite the log with one line per profile once it holds mostly stale entries."""
+        if self._log_lines <= 2 * len(self._profiles):
+            return
+        self._rewrite_log()
+
+    def _rewrite_log(self) -> None:
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        lines = [_serialise_profile(profile) + "\n" for profile in self._profiles.values()]
         temp_path = self._file_path.with_suffix(".tmp")
-        temp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        temp_path.write_bytes("".join(lines).encode("utf-8"))
         temp_path.replace(self._file_path)
+        self._log_lines = len(lines)
 
     def get(self, user_id: str) -> Optional[UserProfile]:
         return self._profiles.get(user_id)
 
-    def extract_and_store(self, user_id: Optional[str], message: str) -> tuple[Optional[UserProfile], Dict[str, Optional[str]]]:
+    def extract_and_store(
+        self,
+        user_id: Optional[str],
+        message: str,
+        *,
+        now: Optional[datetime] = None,
+    ) -> tuple[Optional[UserProfile], Dict[str, Optional[str]]]:
         if not user_id:
             return None, {}
         profile = self._profiles.get(user_id) or UserProfile(user_id=user_id)
@@ -122,9 +168,9 @@ class UserProfileTool:
             profile.plan = plan
             updates["plan"] = plan
         if updates:
-            profile.last_updated = datetime.now(timezone.utc)
+            profile.last_updated = now or datetime.now(timezone.utc)
             self._profiles[user_id] = profile
-            self._persist_profiles()
+            self._persist_profile(profile)
         elif user_id not in self._profiles:
             self._profiles[user_id] = profile
         return profile, updates
@@ -135,16 +181,44 @@ class UserProfileTool:
         return profile.as_masked_dict()
 
 
+def _profile_from_record(record: Dict[str, object]) -> UserProfile:
+    return UserProfile(
+        user_id=str(record["user_id"]),
+        email=record.get("email"),
+        plan=record.get("plan"),
+        last_updated=datetime.fromisoformat(record["last_updated"]),
+    )
+
+
+def _serialise_profile(profile: UserProfile) -> str:
+    return json.dumps(
+        {
+            "user_id": profile.user_id,
+            "email": profile.email,
+            "plan": profile.plan,
+            "last_updated": profile.last_updated.isoformat(),
+        },
+        ensure_ascii=False,
+    )
+
+
 def _find_email(message: str) -> Optional[str]:
-    match = _EMAIL_PATTERN.search(message or "")
+    if not message or "@" not in message:
+        return None
+    match = _EMAIL_PATTERN.search(message)
     return match.group(0).lower() if match else None
 
 
 def _find_plan(message: str) -> Optional[str]:
     if not message:
         return None
-    normalised = strip_portuguese_accents(message.lower())
-    for pattern, label in _PLAN_PATTERNS.items():
+    normalised = _normalise_for_plan(message)
+    for pattern, label in _PLAN_LABELS.items():
         if pattern in normalised:
             return label
     return None
+
+
+@lru_cache(maxsize=1024)
+def _normalise_for_plan(message: str) -> str:
+    return strip_accents_and_lower(message)
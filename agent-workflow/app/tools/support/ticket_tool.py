@@ -7,9 +7,10 @@ import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from app.settings import settings
+from app.utils.jsonl import dumps_line
 
 from .contracts import Ticket, TicketCreateRequest
 
@@ -28,21 +29,22 @@ class TicketTool:
         self._file_path = Path(settings.support_tickets_file_path) if file_path is None else file_path
         self._id_factory = id_factory or self._generate_id
         self._tickets: Dict[str, Ticket] = {}
+        self._by_user: Dict[str, List[Ticket]] = {}
         self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
         if self._persist:
             self._load_from_file()
 
     def _load_from_file(self) -> None:
+        """Replay the append-only ticket log; later lines win.
+
+        Files written before the log format held a single JSON array; those are
+        read once and rewritten as one ticket per line.
+        """
         if not self._file_path.exists():
             return
         try:
-            payload = json.loads(self._file_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            logger.error(
-                "support.ticket.persistence_invalid",
-                extra={"path": str(self._file_path), "error": str(exc)},
-            )
-            return
+            text = self._file_path.read_text(encoding="utf-8-sig")
         except OSError as exc:
             logger.error(
                 "support.ticket.persistence_unreadable",
@@ -50,7 +52,30 @@ class TicketTool:
             )
             return
 
-        for record in payload:
+        legacy = text.lstrip().startswith("[")
+        if legacy:
+            try:
+                records = json.loads(text)
+            except json.JSONDecodeError as exc:
+                logger.error(
+                    "support.ticket.persistence_invalid",
+                    extra={"path": str(self._file_path), "error": str(exc)},
+                )
+                return
+        else:
+            records = []
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError as exc:
+                    logger.warning(
+                        "support.ticket.persistence_item_invalid",
+                        extra={"path": str(self._file_path), "error": str(exc)},
+                    )
+
+        for record in records:
             try:
                 ticket = Ticket(
                     id=str(record["id"]),
@@ -75,67 +100,98 @@ class TicketTool:
                 continue
             self._tickets[ticket.id] = ticket
 
-    def _persist_to_file(self) -> None:
+        # built after the replay so a ticket rewritten later in the log is indexed once
+        for ticket in self._tickets.values():
+            self._index_ticket(ticket)
+
+        if legacy:
+            try:
+                self._rewrite_log()
+            except OSError as exc:
+                logger.error(
+                    "support.ticket.persistence_failed",
+                    extra={"path": str(self._file_path), "error": str(exc)},
+                )
+
+    def _index_ticket(self, ticket: Ticket) -> None:
+        if ticket.user_id is not None:
+            self._by_user.setdefault(ticket.user_id, []).append(ticket)
+
+    def _persist_ticket(self, ticket: Ticket) -> None:
         if not self._persist:
             return
-        data = [
-            {
-                "id": ticket.id,
-                "summary": ticket.summary,
-                "description": ticket.description,
-                "user_id": ticket.user_id,
-                "status": ticket.status,
-                "priority": ticket.priority,
-                "category": ticket.category,
-                "channel": ticket.channel,
-                "created_at": ticket.created_at.isoformat(),
-                "updated_at": ticket.updated_at.isoformat(),
-                "escalation": ticket.escalation,
-                "internal_notes": ticket.internal_notes,
-                "profile_snapshot": ticket.profile_snapshot,
-            }
-            for ticket in self._tickets.values()
-        ]
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        line = dumps_line(_ticket_record(ticket))
+        # binary append: each create writes one line instead of the whole file
+        with self._write_lock, self._file_path.open("ab") as handle:
+            handle.write(line)
+
+    def _rewrite_log(self) -> None:
+        with self._lock:
+            tickets = list(self._tickets.values())
         temp_path = self._file_path.with_suffix(".tmp")
-        temp_path.parent.mkdir(parents=True, exist_ok=True)
-        temp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        temp_path.write_bytes(b"".join(dumps_line(_ticket_record(ticket)) for ticket in tickets))
         os.replace(temp_path, self._file_path)
 
     def create(self, request: TicketCreateRequest) -> Ticket:
+        now = datetime.now(timezone.utc)
+        ticket = Ticket(
+            id=self._id_factory(),
+            summary=request.summary,
+            description=request.description,
+            user_id=request.user_id,
+            status="open",
+            priority=request.priority,
+            category=request.category,
+            channel=request.channel,
+            created_at=now,
+            updated_at=now,
+            escalation=request.escalation,
+            profile_snapshot=request.profile_snapshot,
+        )
+        # only the in-memory maps are shared; the append below has its own lock
         with self._lock:
-            ticket_id = self._id_factory()
-            now = datetime.now(timezone.utc)
-            ticket = Ticket(
-                id=ticket_id,
-                summary=request.summary,
-                description=request.description,
-                user_id=request.user_id,
-                status="open",
-                priority=request.priority,
-                category=request.category,
-                channel=request.channel,
-                created_at=now,
-                updated_at=now,
-                escalation=request.escalation,
-                profile_snapshot=request.profile_snapshot,
-            )
+            previous = self._tickets.get(ticket.id)
+            if previous is not None and previous.user_id is not None:
+                self._by_user[previous.user_id].remove(previous)
             self._tickets[ticket.id] = ticket
-            try:
-                self._persist_to_file()
-            except OSError as exc:  # pragma: no cover - logging side effect only
-                logger.error(
-                    "support.ticket.persistence_failed",
-                    extra={"path": str(self._file_path), "error": str(exc)},
-                )
-            return ticket
+            self._index_ticket(ticket)
+        try:
+            self._persist_ticket(ticket)
+        except OSError as exc:  # pragma: no cover - logging side effect only
+            logger.error(
+                "support.ticket.persistence_failed",
+                extra={"path": str(self._file_path), "error": str(exc)},
+            )
+        return ticket
 
     def get(self, ticket_id: str) -> Optional[Ticket]:
         return self._tickets.get(ticket_id)
 
     def list_by_user(self, user_id: str) -> List[Ticket]:
-        return [ticket for ticket in self._tickets.values() if ticket.user_id == user_id]
+        return list(self._by_user.get(user_id, ()))
 
     def _generate_id(self) -> str:
-        base = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-        suffix = int(time.time() * 1000) % 1000
+        # one clock read, so the seconds and millisecond parts always agree
+        now = time.time()
+        base = time.strftime("%Y%m%d%H%M%S", time.gmtime(now))
+        suffix = int(now * 1000) % 1000
         return f"SUP-{base}-{suffix:03d}"
+
+
+def _ticket_record(ticket: Ticket) -> Dict[str, Any]:
+    return {
+        "id": ticket.id,
+        "summary": ticket.summary,
+        "description": ticket.description,
+        "user_id": ticket.user_id,
+        "status": ticket.status,
+        "priority": ticket.priority,
+        "category": ticket.category,
+        "channel": ticket.channel,
+        "created_at": ticket.created_at.isoformat(),
+        "updated_at": ticket.updated_at.isoformat(),
+        "escalation": ticket.escalation,
+        "internal_notes": ticket.internal_notes,
+        "profile_snapshot": ticket.profile_snapshot,
+    }
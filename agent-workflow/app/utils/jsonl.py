@@ -0,0 +1,12 @@
+"""JSON Lines serialisation shared by the append-only logs and the RAG index."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+
+def dumps_line(record: Any) -> bytes:
+    """Serialise ``record`` as one UTF-8 encoded JSON line, newline included."""
+    return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
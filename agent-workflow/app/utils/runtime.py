@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timezone
 
 
@@ -6,9 +7,11 @@ class RuntimeState:
 
     def __init__(self) -> None:
         self.started_at = datetime.now(timezone.utc)
+        # wall-clock start is kept for reporting; uptime uses the monotonic clock
+        self._started_monotonic = time.monotonic()
 
     def uptime_seconds(self) -> float:
-        return (datetime.now(timezone.utc) - self.started_at).total_seconds()
+        return time.monotonic() - self._started_monotonic
 
 
 runtime_state = RuntimeState()
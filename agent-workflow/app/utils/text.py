@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import string
 from typing import Final
 
 _PORTUGUESE_ACCENT_TRANSLATION: Final[dict[int, str]] = {
@@ -55,10 +56,30 @@ _PORTUGUESE_ACCENT_TRANSLATION: Final[dict[int, str]] = {
     ord("Ñ"): "N",
 }
 
+# ASCII uppercase plus every accented letter, mapped straight to lowercase ASCII
+_LOWER_AND_STRIP_TRANSLATION: Final[dict[int, str]] = {
+    **{ord(letter): letter.lower() for letter in string.ascii_uppercase},
+    **{code: replacement.lower() for code, replacement in _PORTUGUESE_ACCENT_TRANSLATION.items()},
+}
+
 
 def strip_portuguese_accents(text: str) -> str:
     """Replace common Portuguese accented characters with their ASCII equivalent."""
 
-    if not text:
+    # isascii() reads a flag on the string object, so ASCII input skips the scan entirely
+    if not text or text.isascii():
         return text
     return text.translate(_PORTUGUESE_ACCENT_TRANSLATION)
+
+
+def strip_accents_and_lower(text: str) -> str:
+    """Lowercase ``text`` and strip Portuguese accents in a single pass.
+
+    Equivalent to ``strip_portuguese_accents(text.lower())``; characters outside
+    the translation table fall back to ``str.lower``.
+    """
+
+    if not text:
+        return text
+    folded = text.translate(_LOWER_AND_STRIP_TRANSLATION)
+    return folded if folded.isascii() else folded.lower()
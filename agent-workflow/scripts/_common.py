@@ -0,0 +1,26 @@
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def ensure_project_root() -> None:
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def dump_result(result) -> None:
+    print(
+        json.dumps(
+            {
+                "dry_run": result.dry_run,
+                "processed_urls": result.processed_urls,
+                "raw_documents": result.raw_count,
+                "chunks_created": result.chunks_count,
+                "embedded_chunks": result.embedded_count,
+                "index_items": result.index_count,
+            },
+            indent=2,
+        )
+    )
@@ -1,6 +1,18 @@
 import sys
 from pathlib import Path
 
+import pytest
+from fastapi.testclient import TestClient
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.main import app  # noqa: E402  (needs the project root on sys.path)
+
+
+@pytest.fixture(scope="session")
+def client():
+    # one startup for the whole run; tests vary behaviour through settings and dependency overrides
+    with TestClient(app) as test_client:
+        yield test_client
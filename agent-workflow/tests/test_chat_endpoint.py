@@ -7,36 +7,41 @@ from app.routers import chat as chat_router
 from app.settings import settings
 
 
+_DUMMY_ROUTES = (
+    ("policy", RoutingDecision(route=Route.knowledge, hint="docs", confidence=0.85)),
+    ("payment", RoutingDecision(route=Route.support, hint="support", confidence=0.8)),
+    ("uncertain", RoutingDecision(route=Route.knowledge, hint="docs", confidence=0.2)),
+    ("human", RoutingDecision(route=Route.slack, hint="handoff", confidence=1.0)),
+)
+_DUMMY_DEFAULT_ROUTE = RoutingDecision(route=Route.custom, hint="custom", confidence=0.6)
+
+
 class DummyRouter:
     def route_message(self, message: str) -> RoutingDecision:
         text = message.lower()
-        if "policy" in text:
-            return RoutingDecision(route=Route.knowledge, hint="docs", confidence=0.85)
-        if "payment" in text:
-            return RoutingDecision(route=Route.support, hint="support", confidence=0.8)
-        if "uncertain" in text:
-            return RoutingDecision(route=Route.knowledge, hint="docs", confidence=0.2)
-        if "human" in text:
-            return RoutingDecision(route=Route.slack, hint="handoff", confidence=1.0)
-        return RoutingDecision(route=Route.custom, hint="custom", confidence=0.6)
+        return next((decision for needle, decision in _DUMMY_ROUTES if needle in text), _DUMMY_DEFAULT_ROUTE)
 
 
 class StubAgent:
+    __slots__ = ("name", "_response")
+
     def __init__(self, name: str, content: str):
         self.name = name
-        self._content = content
-
-    def run(self, request: AgentRequest) -> AgentResponse:
-        return AgentResponse(
-            agent=self.name,
-            content=self._content,
+        # the chat router copies meta before annotating it, so one response can be shared
+        self._response = AgentResponse(
+            agent=name,
+            content=content,
             citations=[{"title": "Knowledge Base", "url": "https://www.infinitepay.io", "source_type": "infinitepay"}],
-            meta={"rag_used": self.name == "knowledge"},
+            meta={"rag_used": name == "knowledge"},
         )
 
+    def run(self, request: AgentRequest) -> AgentResponse:
+        return self._response
+
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module", autouse=True)
 def override_dependencies() -> None:
+    # installed once for the module and removed afterwards, since other modules share the global app
     app.dependency_overrides[chat_router.get_router_agent] = lambda: DummyRouter()
 
     def _factory():
@@ -53,12 +58,6 @@ def override_dependencies() -> None:
     app.dependency_overrides.pop(chat_router.get_agents, None)
 
 
-@pytest.fixture
-def client() -> TestClient:
-    with TestClient(app) as test_client:
-        yield test_client
-
-
 @pytest.mark.parametrize(
     "message,expected_agent",
     [
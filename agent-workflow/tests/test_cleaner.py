@@ -0,0 +1,22 @@
+from app.rag.cleaner import clean_document
+from app.rag.loader import RawDocument
+
+
+def test_cleaner_keeps_article_text_and_drops_chrome():
+    raw = RawDocument(
+        url="https://example.com",
+        status=200,
+        title=None,
+        html=(
+            "<html><head><title> Exemplo </title><script>var x = 1;</script></head>"
+            "<body><nav>Menu</nav><article><p>Primeiro paragrafo.</p>\r\n\r\n<p>Segundo   paragrafo.</p></article>"
+            "<footer>Rodape</footer></body></html>"
+        ),
+        captured_at="2024-01-01T00:00:00Z",
+        content_hash="abc123",
+    )
+
+    doc = clean_document(raw)
+
+    assert doc.title == "Exemplo"
+    assert doc.text == "Primeiro paragrafo. Segundo paragrafo."
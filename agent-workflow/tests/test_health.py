@@ -1,18 +1,8 @@
-import asyncio
+from fastapi.testclient import TestClient
 
-from httpx import AsyncClient
 
-from app.main import app
-
-
-async def _request_health():
-    async with AsyncClient(app=app, base_url="http://testserver") as client:
-        response = await client.get("/health")
-    return response
-
-
-def test_health_endpoint():
-    response = asyncio.run(_request_health())
+def test_health_endpoint(client: TestClient):
+    response = client.get("/health")
 
     assert response.status_code == 200
 
@@ -0,0 +1,31 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from app.rag.indexer import build_index
+from app.rag.splitter import Chunk
+
+
+def _chunk(order: int) -> Chunk:
+    return Chunk(id=f"abc-{order}", url="https://example.com", title="Exemplo", order=order, text=f"Texto {order}", content_hash="abc")
+
+
+def test_build_index_writes_one_line_per_chunk(tmp_path: Path):
+    artifact = build_index([_chunk(0), _chunk(1)], index_dir=tmp_path)
+
+    lines = artifact.path.read_text(encoding="utf-8").splitlines()
+    assert artifact.count == 2
+    assert [json.loads(line)["id"] for line in lines] == ["abc-0", "abc-1"]
+    assert list(tmp_path.iterdir()) == [artifact.path]
+
+
+def test_build_index_leaves_no_file_when_chunks_fail(tmp_path: Path):
+    def failing_chunks():
+        yield _chunk(0)
+        raise RuntimeError("splitter failed")
+
+    with pytest.raises(RuntimeError):
+        build_index(failing_chunks(), index_dir=tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
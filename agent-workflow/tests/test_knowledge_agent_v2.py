@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import List
 
 import pytest
@@ -13,6 +14,8 @@ from app.settings import settings
 
 
 class StubRetriever:
+    __slots__ = ("_results",)
+
     def __init__(self, results: List[RetrievedChunk]):
         self._results = results
 
@@ -21,6 +24,8 @@ class StubRetriever:
 
 
 class StubReranker:
+    __slots__ = ()
+
     def rerank(self, query: str, chunks):
         for chunk in chunks:
             chunk.rank_score = (chunk.rank_score or 0) + 1
@@ -28,6 +33,8 @@ class StubReranker:
 
 
 class StubProvider:
+    __slots__ = ("text", "should_fail")
+
     def __init__(self, text: str, should_fail: bool = False):
         self.text = text
         self.should_fail = should_fail
@@ -39,6 +46,8 @@ class StubProvider:
 
 
 class StubWebSearch:
+    __slots__ = ("_results",)
+
     def __init__(self, results=None):
         self._results = results or []
 
@@ -46,29 +55,41 @@ class StubWebSearch:
         return list(self._results)
 
 
+_QUERY_CACHE = QueryCache(ttl_seconds=300)
+
+
+@pytest.fixture
+def query_cache() -> QueryCache:
+    # one cache for the module, emptied so each test starts without earlier answers
+    _QUERY_CACHE.clear()
+    return _QUERY_CACHE
+
+
+_SAMPLE_CHUNK = RetrievedChunk(
+    id="chunk-1",
+    url="https://www.infinitepay.io/maquininha",
+    title="Maquininha",
+    order=0,
+    text="A maquininha InfinitePay possui taxas competitivas.",
+    raw_score=0.9,
+    content_hash="c1",
+    ingest_timestamp=None,
+    rank_score=0.9,
+)
+
+
 @pytest.fixture
 def sample_chunks() -> List[RetrievedChunk]:
-    return [
-        RetrievedChunk(
-            id="chunk-1",
-            url="https://www.infinitepay.io/maquininha",
-            title="Maquininha",
-            order=0,
-            text="A maquininha InfinitePay possui taxas competitivas.",
-            raw_score=0.9,
-            content_hash="c1",
-            ingest_timestamp=None,
-            rank_score=0.9,
-        )
-    ]
-
-
-def test_knowledge_agent_returns_citations(sample_chunks):
+    # StubReranker bumps rank_score in place, so every test gets its own copy
+    return [replace(_SAMPLE_CHUNK)]
+
+
+def test_knowledge_agent_returns_citations(sample_chunks, query_cache):
     agent = KnowledgeAgent(
         provider=StubProvider("Resposta fundamentada."),
         retriever=StubRetriever(sample_chunks),
         reranker=StubReranker(),
-        cache=QueryCache(ttl_seconds=300),
+        cache=query_cache,
         web_search=StubWebSearch(),
     )
 
@@ -80,12 +101,12 @@ def test_knowledge_agent_returns_citations(sample_chunks):
     assert response.meta["fallback_used"] is False
 
 
-def test_knowledge_agent_fallback_when_no_results():
+def test_knowledge_agent_fallback_when_no_results(query_cache):
     agent = KnowledgeAgent(
         provider=StubProvider("fallback"),
         retriever=StubRetriever([]),
         reranker=StubReranker(),
-        cache=QueryCache(ttl_seconds=300),
+        cache=query_cache,
         web_search=StubWebSearch(),
     )
 
@@ -96,13 +117,12 @@ def test_knowledge_agent_fallback_when_no_results():
     assert any("infinitepay.io" in citation["url"] for citation in response.citations)
 
 
-def test_knowledge_agent_handles_greetings_and_tracks_history():
-    cache = QueryCache(ttl_seconds=300)
+def test_knowledge_agent_handles_greetings_and_tracks_history(query_cache):
     agent = KnowledgeAgent(
         provider=StubProvider("fallback"),
         retriever=StubRetriever([]),
         reranker=StubReranker(),
-        cache=cache,
+        cache=query_cache,
         web_search=StubWebSearch(),
     )
 
@@ -117,13 +137,12 @@ def test_knowledge_agent_handles_greetings_and_tracks_history():
     assert "ainda não encontrei" in second.content.lower()
 
 
-def test_knowledge_agent_switches_language_based_on_query():
-    cache = QueryCache(ttl_seconds=300)
+def test_knowledge_agent_switches_language_based_on_query(query_cache):
     agent = KnowledgeAgent(
         provider=StubProvider("fallback"),
         retriever=StubRetriever([]),
         reranker=StubReranker(),
-        cache=cache,
+        cache=query_cache,
         web_search=StubWebSearch(),
     )
 
@@ -136,13 +155,12 @@ def test_knowledge_agent_switches_language_based_on_query():
     assert english.meta["response_language"] == "en"
 
 
-def test_knowledge_agent_remembers_user_name():
-    cache = QueryCache(ttl_seconds=300)
+def test_knowledge_agent_remembers_user_name(query_cache):
     agent = KnowledgeAgent(
         provider=StubProvider("fallback"),
         retriever=StubRetriever([]),
         reranker=StubReranker(),
-        cache=cache,
+        cache=query_cache,
         web_search=StubWebSearch(),
     )
 
@@ -156,13 +174,12 @@ def test_knowledge_agent_remembers_user_name():
     assert second.meta["response_language"] == "pt"
 
 
-def test_knowledge_agent_cache_hit(sample_chunks):
-    cache = QueryCache(ttl_seconds=300)
+def test_knowledge_agent_cache_hit(sample_chunks, query_cache):
     agent = KnowledgeAgent(
         provider=StubProvider("Resposta."),
         retriever=StubRetriever(sample_chunks),
         reranker=StubReranker(),
-        cache=cache,
+        cache=query_cache,
         web_search=StubWebSearch(),
     )
 
@@ -173,14 +190,14 @@ def test_knowledge_agent_cache_hit(sample_chunks):
     assert second.meta["cache_hit"] is True
 
 
-def test_knowledge_agent_uses_web_search(monkeypatch):
+def test_knowledge_agent_uses_web_search(monkeypatch, query_cache):
     monkeypatch.setattr(settings, "web_search_enabled", True)
     web_results = [WebSearchResult(title="Artigo Externo", url="https://example.com/artigo", snippet="Resumo externo.")]
     agent = KnowledgeAgent(
         provider=StubProvider("Resposta externa."),
         retriever=StubRetriever([]),
         reranker=StubReranker(),
-        cache=QueryCache(ttl_seconds=300),
+        cache=query_cache,
         web_search=StubWebSearch(web_results),
     )
 
@@ -12,6 +12,8 @@ class LoggingRouter:
 
 
 class LoggingAgent:
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         self.name = name
 
@@ -20,7 +22,7 @@ class LoggingAgent:
 
 
 @pytest.fixture
-def logging_client() -> TestClient:
+def logging_client(client: TestClient) -> TestClient:
     app.dependency_overrides[chat_router.get_router_agent] = lambda: LoggingRouter()
 
     def _factory():
@@ -32,8 +34,7 @@ def logging_client() -> TestClient:
         }
 
     app.dependency_overrides[chat_router.get_agents] = _factory
-    with TestClient(app) as test_client:
-        yield test_client
+    yield client
     app.dependency_overrides.pop(chat_router.get_router_agent, None)
     app.dependency_overrides.pop(chat_router.get_agents, None)
 
@@ -52,7 +53,8 @@ def test_correlation_id_propagated_to_logs(logging_client: TestClient, caplog: p
     assert payload["meta"]["correlation_id"] == "abc123"
     assert response.headers["X-Correlation-ID"] == "abc123"
 
-    success_record = next(record for record in caplog.records if record.getMessage() == "chat.success")
+    # event names are logged without %-args, so the raw msg can be compared without formatting
+    success_record = next(record for record in caplog.records if record.msg == "chat.success")
     assert success_record.correlation_id == "abc123"
     assert success_record.route == "knowledge"
     assert success_record.agent == "knowledge"
@@ -17,6 +17,8 @@ class MetricsRouter:
 
 
 class MetricsStubAgent:
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         self.name = name
 
@@ -25,6 +27,13 @@ class MetricsStubAgent:
         return AgentResponse(agent=self.name, content=f"handled:{self.name}", citations=[], meta=meta)
 
 
+_EXPECTED_COUNTER_LINES = (
+    'chat_requests_total{agent="knowledge"} 1',
+    'chat_requests_total{agent="support"} 0',
+    "chat_redirect_total 0",
+)
+
+
 @pytest.fixture(autouse=True)
 def reset_metrics_registry() -> None:
     registry = get_metrics_registry()
@@ -34,7 +43,7 @@ def reset_metrics_registry() -> None:
 
 
 @pytest.fixture
-def metrics_client() -> TestClient:
+def metrics_client(client: TestClient) -> TestClient:
     app.dependency_overrides[chat_router.get_router_agent] = lambda: MetricsRouter()
 
     def _factory():
@@ -46,8 +55,7 @@ def metrics_client() -> TestClient:
         }
 
     app.dependency_overrides[chat_router.get_agents] = _factory
-    with TestClient(app) as test_client:
-        yield test_client
+    yield client
     app.dependency_overrides.pop(chat_router.get_router_agent, None)
     app.dependency_overrides.pop(chat_router.get_agents, None)
 
@@ -61,10 +69,9 @@ def test_metrics_endpoint_reports_counters(metrics_client: TestClient) -> None:
     assert metrics_response.status_code == 200
     body = metrics_response.text
 
-    assert 'chat_requests_total{agent="knowledge"} 1' in body
-    assert 'chat_requests_total{agent="support"} 0' in body
-    assert 'chat_redirect_total 0' in body
-    assert f'correlation_id="{correlation_id}"' in body
+    expected = (*_EXPECTED_COUNTER_LINES, f'correlation_id="{correlation_id}"')
+    missing = [needle for needle in expected if needle not in body]
+    assert not missing, missing
 
 
 def test_metrics_latency_bucket_for_slow_request(metrics_client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
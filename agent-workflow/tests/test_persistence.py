@@ -21,8 +21,8 @@ def test_persistence_roundtrip(tmp_path: Path) -> None:
     )
 
     raw_path = save_raw_documents([raw_doc], directory=raw_dir)
-    saved_raw = raw_path.read_text(encoding="utf-8").strip()
-    assert "https://example.com" in saved_raw
+    saved_raw = raw_path.read_bytes()
+    assert b"https://example.com" in saved_raw
 
     chunk = Chunk(
         id="abc123-0",
@@ -33,7 +33,8 @@ def test_persistence_roundtrip(tmp_path: Path) -> None:
         content_hash="abc123",
     )
     chunks_path = save_chunks([chunk], directory=chunks_dir, stage="test")
-    saved_chunk = json.loads(chunks_path.read_text(encoding="utf-8").splitlines()[0])
+    with chunks_path.open("rb") as handle:
+        saved_chunk = json.loads(handle.readline())
     assert saved_chunk["id"] == "abc123-0"
 
     manifest = Manifest(
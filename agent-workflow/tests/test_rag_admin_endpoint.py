@@ -1,10 +1,24 @@
+from typing import Iterable
+
+import pytest
 from fastapi.testclient import TestClient
 
 from app import main
 from app.rag.runner import RAGResult
+from app.routers import rag_admin
 from app.settings import settings
 
 
+@pytest.fixture(scope="module")
+def admin_client() -> Iterable[TestClient]:
+    # the admin router is registered at build time, so one enabled app serves the module
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(settings, "rag_admin_enabled", True)
+        app_instance = main.create_app()
+    with TestClient(app_instance) as client:
+        yield client
+
+
 def test_rag_admin_endpoint_disabled(monkeypatch):
     monkeypatch.setattr(settings, "rag_admin_enabled", False)
     app_instance = main.create_app()
@@ -14,27 +28,20 @@ def test_rag_admin_endpoint_disabled(monkeypatch):
     assert response.status_code == 404
 
 
-def test_rag_admin_endpoint_requires_confirmation(monkeypatch):
-    monkeypatch.setattr(settings, "rag_admin_enabled", True)
-    app_instance = main.create_app()
-    monkeypatch.setattr("app.routers.rag_admin.RAGRunner.run", lambda self: RAGResult(1, 1, 1, 0, 0, True))
-    client = TestClient(app_instance)
+def test_rag_admin_endpoint_requires_confirmation(monkeypatch, admin_client: TestClient):
+    monkeypatch.setattr(rag_admin.RAGRunner, "run", lambda self: RAGResult(1, 1, 1, 0, 0, True))
 
-    response = client.post("/rag/reindex", json={"confirm": False})
+    response = admin_client.post("/rag/reindex", json={"confirm": False})
     assert response.status_code == 400
 
 
-def test_rag_admin_endpoint_runs(monkeypatch):
-    monkeypatch.setattr(settings, "rag_admin_enabled", True)
-    app_instance = main.create_app()
-
+def test_rag_admin_endpoint_runs(monkeypatch, admin_client: TestClient):
     def fake_run(self):
         return RAGResult(processed_urls=2, raw_count=2, chunks_count=4, embedded_count=0, index_count=0, dry_run=True)
 
-    monkeypatch.setattr("app.routers.rag_admin.RAGRunner.run", fake_run)
-    client = TestClient(app_instance)
+    monkeypatch.setattr(rag_admin.RAGRunner, "run", fake_run)
 
-    response = client.post("/rag/reindex", json={"confirm": True, "dry_run": True})
+    response = admin_client.post("/rag/reindex", json={"confirm": True, "dry_run": True})
     assert response.status_code == 200
     payload = response.json()
     assert payload["dry_run"] is True
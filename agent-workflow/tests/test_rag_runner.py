@@ -35,7 +35,8 @@ def test_rag_runner_dry_run(tmp_path: Path) -> None:
     assert result.dry_run is True
     assert result.raw_count == 1
     assert result.chunks_count == 1
-    raw_files = list((base / "raw").glob("*.jsonl"))
-    chunk_files = list((base / "chunks").glob("chunks_clean_*.jsonl"))
-    manifest_files = list((base / "index").glob("manifest_*.json"))
-    assert raw_files and chunk_files and manifest_files
+    assert result.raw_path.parent == base / "raw"
+    assert result.chunks_path.parent == base / "chunks"
+    assert result.chunks_path.name.startswith("chunks_clean_")
+    assert result.manifest_path.parent == base / "index"
+    assert result.raw_path.exists() and result.chunks_path.exists() and result.manifest_path.exists()
@@ -22,12 +22,11 @@ class MockRouterAgent:
         return RoutingDecision(route=Route.custom, hint="General inquiry")
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def override_router_agent() -> Generator[None, None, None]:
-    def _factory() -> MockRouterAgent:
-        return MockRouterAgent()
-
-    app.dependency_overrides[get_router_agent] = _factory
+    # only the /route endpoint cases need the override; the mock is stateless, so one instance serves every request
+    router = MockRouterAgent()
+    app.dependency_overrides[get_router_agent] = lambda: router
     yield
     app.dependency_overrides.pop(get_router_agent, None)
 
@@ -42,9 +41,9 @@ def override_router_agent() -> Generator[None, None, None]:
         ("Quero falar com humano agora", Route.slack.value),
     ],
 )
-def test_route_endpoint_returns_expected_route(message: str, expected_route: str) -> None:
-    with TestClient(app) as client:
-        response = client.post("/route", json={"message": message})
+@pytest.mark.usefixtures("override_router_agent")
+def test_route_endpoint_returns_expected_route(client: TestClient, message: str, expected_route: str) -> None:
+    response = client.post("/route", json={"message": message})
 
     assert response.status_code == 200
 
@@ -1,28 +1,23 @@
 ﻿import pytest
-from fastapi.testclient import TestClient
 
 from app.agents.handoff_flow import HandoffFlow
 from app.agents.slack_agent import SlackAgent
-from app.main import app
 from app.routers import chat as chat_router
 from app.services.slack.client import MockSlackClient
 from app.settings import settings
 
 
+_FLOW = HandoffFlow(ttl_seconds=300)
+_SLACK_AGENT = SlackAgent(slack_client=MockSlackClient(), handoff_flow=_FLOW)
+
+
 @pytest.fixture(autouse=True)
 def override_handoff(monkeypatch):
-    flow = HandoffFlow(ttl_seconds=300)
-    slack_agent = SlackAgent(slack_client=MockSlackClient(), handoff_flow=flow)
-    monkeypatch.setattr(chat_router, "_handoff_flow", flow)
-    monkeypatch.setattr(chat_router, "_slack_agent", slack_agent)
+    monkeypatch.setattr(chat_router, "_handoff_flow", _FLOW)
+    monkeypatch.setattr(chat_router, "_slack_agent", _SLACK_AGENT)
     monkeypatch.setattr(settings, "slack_enabled", True)
     yield
-
-
-@pytest.fixture
-def client():
-    with TestClient(app) as test_client:
-        yield test_client
+    _FLOW.reset()
 
 
 def test_support_escalation_to_slack_flow(client):
@@ -1,15 +1,27 @@
 ﻿import time
 
+import httpx
 import pytest
 
 from app.agents.handoff_flow import HandoffFlow
 from app.agents.slack_agent import SlackAgent
 from app.agents.base import AgentRequest
-from app.services.slack.client import MockSlackClient, SlackPayload
+from app.services.slack.client import CircuitBreaker, MockSlackClient, RealSlackClient, SlackPayload
 from app.services.slack.payloads import SlackContext, build_slack_message
 from app.settings import settings
 
 
+_FLOW = HandoffFlow(ttl_seconds=300)
+_AGENT = SlackAgent(slack_client=MockSlackClient(), handoff_flow=_FLOW)
+
+
+@pytest.fixture
+def slack_agent():
+    # the agent and flow are shared by the module; only the pending handoffs are reset between tests
+    yield _AGENT, _FLOW
+    _FLOW.reset()
+
+
 def test_build_slack_message_masks_pii(monkeypatch):
     monkeypatch.setattr(settings, "pii_masking_enabled", True)
     context = SlackContext(
@@ -39,8 +51,8 @@ def test_mock_slack_client_returns_result():
     assert result.message_id.startswith("mock-")
 
 
-def test_slack_agent_disabled_flow(monkeypatch):
-    flow = HandoffFlow(ttl_seconds=300)
+def test_slack_agent_disabled_flow(monkeypatch, slack_agent):
+    agent, flow = slack_agent
     pending = flow.register(
         correlation_id="corr-x",
         user_id="user-1",
@@ -52,7 +64,6 @@ def test_slack_agent_disabled_flow(monkeypatch):
         source="unit",
     )
     monkeypatch.setattr(settings, "slack_enabled", False)
-    agent = SlackAgent(slack_client=MockSlackClient(), handoff_flow=flow)
     request = AgentRequest(
         message="yes",
         user_id="user-1",
@@ -64,10 +75,9 @@ def test_slack_agent_disabled_flow(monkeypatch):
     assert "temporarily unavailable" in response.content.lower()
 
 
-def test_slack_agent_request_creates_pending(monkeypatch):
-    flow = HandoffFlow(ttl_seconds=300)
+def test_slack_agent_request_creates_pending(monkeypatch, slack_agent):
+    agent, flow = slack_agent
     monkeypatch.setattr(settings, "slack_enabled", True)
-    agent = SlackAgent(slack_client=MockSlackClient(), handoff_flow=flow)
     request = AgentRequest(
         message="I want to speak with a human",
         user_id="user-5",
@@ -85,3 +95,148 @@ def test_slack_agent_request_creates_pending(monkeypatch):
     assert token
     pending = flow.fetch(correlation_id="corr-req", user_id="user-5", token=token)
     assert pending is not None
+
+
+def test_handoff_flow_reset_drops_pending_handoffs():
+    flow = HandoffFlow(ttl_seconds=300)
+    pending = flow.register(
+        correlation_id="corr-reset",
+        user_id="user-reset",
+        ticket_id=None,
+        category=None,
+        priority=None,
+        summary="Summary",
+        details="Details",
+        source="unit",
+    )
+
+    flow.reset()
+
+    assert flow.fetch(correlation_id="corr-reset", user_id="user-reset", token=pending.token) is None
+
+
+def test_real_slack_client_does_not_retry_client_errors(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(404)
+
+    monkeypatch.setattr("app.services.slack.client.time.sleep", lambda _delay: None)
+    client = RealSlackClient(
+        webhook_url="https://hooks.example.com/x",
+        bot_token=None,
+        timeout=1.0,
+        retries=3,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    result = client.send_message(SlackPayload(channel="#test", text="hello", blocks=[]))
+
+    assert result.ok is False
+    assert result.error == "http_404"
+    assert len(calls) == 1
+
+
+def test_real_slack_client_opens_circuit_after_failures(monkeypatch):
+    calls = []
+    sleeps = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(503)
+
+    monkeypatch.setattr("app.services.slack.client.time.sleep", sleeps.append)
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60.0)
+    client = RealSlackClient(
+        webhook_url="https://hooks.example.com/x",
+        bot_token=None,
+        timeout=1.0,
+        retries=1,
+        breaker=breaker,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    payload = SlackPayload(channel="#test", text="hello", blocks=[])
+
+    assert client.send_message(payload).error == "http_503"
+    assert client.send_message(payload).error == "http_503"
+    assert breaker.is_open
+    assert len(calls) == 4
+    assert len(sleeps) == 2
+
+    result = client.send_message(payload)
+    assert result.error == "circuit_open"
+    assert len(calls) == 4
+
+
+def test_real_slack_client_client_errors_do_not_open_circuit():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(404)
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60.0)
+    client = RealSlackClient(
+        webhook_url="https://hooks.example.com/x",
+        bot_token=None,
+        timeout=1.0,
+        retries=0,
+        breaker=breaker,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    payload = SlackPayload(channel="#test", text="hello", blocks=[])
+
+    for _ in range(3):
+        assert client.send_message(payload).error == "http_404"
+    assert not breaker.is_open
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize(
+    ("webhook_url", "bot_token"),
+    [("https://hooks.example.com/x", None), (None, "xoxb-test")],
+)
+def test_real_slack_client_treats_plain_text_2xx_as_sent(webhook_url, bot_token):
+    client = RealSlackClient(
+        webhook_url=webhook_url,
+        bot_token=bot_token,
+        timeout=1.0,
+        retries=0,
+        http_client=httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, text="ok"))),
+    )
+
+    result = client.send_message(SlackPayload(channel="#test", text="hello", blocks=[]))
+
+    assert result.ok is True
+    assert result.message_id
+
+
+def test_real_slack_client_reports_bot_api_errors():
+    client = RealSlackClient(
+        webhook_url=None,
+        bot_token="xoxb-test",
+        timeout=1.0,
+        retries=0,
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": False, "error": "channel_not_found"}))
+        ),
+    )
+
+    result = client.send_message(SlackPayload(channel="#test", text="hello", blocks=[]))
+
+    assert result.ok is False
+    assert result.error == "channel_not_found"
+
+
+def test_real_slack_client_closes_only_its_own_http_client():
+    shared = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+    borrowed = RealSlackClient(webhook_url="https://hooks.example.com/x", bot_token=None, timeout=1.0, retries=0, http_client=shared)
+    owned = RealSlackClient(webhook_url="https://hooks.example.com/x", bot_token=None, timeout=1.0, retries=0)
+
+    borrowed.close()
+    owned.close()
+
+    assert not shared.is_closed
+    assert owned._http.is_closed
+    shared.close()
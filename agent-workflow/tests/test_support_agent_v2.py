@@ -178,3 +178,24 @@ def test_support_agent_handles_account_status_flow(tmp_path, monkeypatch):
     assert response.meta["ticket_id"] is None
     assert "account_status" in response.meta["tools_used"]
     assert "liberar" in response.content.lower()
+
+
+def test_account_status_prefers_dataset_order_over_message_position(tmp_path):
+    account_data = tmp_path / "account_status.json"
+    account_data.write_text(
+        json.dumps(
+            [
+                {"id": "acct-limit", "triggers": ["limite"], "status": "limit_review"},
+                {"id": "acct-pix", "triggers": ["pix bloqueado"], "status": "blocked"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    tool = AccountStatusTool(dataset_path=account_data)
+
+    result = tool.lookup("Meu pix bloqueado passou do limite")
+
+    assert result is not None
+    assert result.record.id == "acct-limit"
+    assert result.matched_trigger == "limite"
+    assert tool.lookup("Nada relacionado") is None
@@ -1,4 +1,5 @@
 ﻿import json
+from dataclasses import FrozenInstanceError
 
 import pytest
 
@@ -61,3 +62,54 @@ def test_faq_tool_scores_by_tags(faq_dataset, monkeypatch):
     assert result is not None
     assert result.item.categoria == "pagamentos"
     assert result.score >= 0.3
+
+
+def test_faq_tool_reuses_index_until_dataset_changes(faq_dataset, monkeypatch):
+    monkeypatch.setattr(settings, "support_faq_score_threshold", 0.3)
+    first = FAQTool(dataset_path=faq_dataset)
+    second = FAQTool(dataset_path=faq_dataset)
+    first.search(FAQQuery("senha"))
+    second.search(FAQQuery("senha"))
+    assert second._index is first._index
+
+    payload = json.loads(faq_dataset.read_text(encoding="utf-8"))
+    payload[1]["tags"].append("estorno")
+    faq_dataset.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    second.reload()
+
+    result = second.search(FAQQuery("Quero um estorno do pagamento"))
+    assert second._index is not first._index
+    assert result is not None
+    assert result.item.id == "item-2"
+
+
+def test_faq_tool_reuses_result_for_repeated_query(faq_dataset, monkeypatch):
+    monkeypatch.setattr(settings, "support_faq_score_threshold", 0.2)
+    tool = FAQTool(dataset_path=faq_dataset)
+
+    first = tool.search(FAQQuery("Esqueci minha senha"))
+    assert tool.search(FAQQuery("esqueci  minha SENHA!")) is first
+
+    monkeypatch.setattr(settings, "support_faq_score_threshold", 0.99)
+    assert tool.search(FAQQuery("Esqueci minha senha")) is None
+
+
+def test_faq_tool_keeps_results_for_interleaved_queries(faq_dataset, monkeypatch):
+    monkeypatch.setattr(settings, "support_faq_score_threshold", 0.2)
+    tool = FAQTool(dataset_path=faq_dataset)
+
+    first = tool.search(FAQQuery("Esqueci minha senha"))
+    tool.search(FAQQuery("Cobranca duplicada no pagamento"))
+
+    assert tool.search(FAQQuery("Esqueci minha senha")) is first
+
+
+def test_faq_tool_cached_results_are_immutable(faq_dataset, monkeypatch):
+    monkeypatch.setattr(settings, "support_faq_score_threshold", 0.2)
+    tool = FAQTool(dataset_path=faq_dataset)
+
+    result = tool.search(FAQQuery("Esqueci minha senha"))
+
+    assert result is not None
+    with pytest.raises(FrozenInstanceError):
+        result.explanation = "changed"
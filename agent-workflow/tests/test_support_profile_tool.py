@@ -0,0 +1,76 @@
+import json
+from datetime import datetime, timezone
+
+from app.tools.support.profile_tool import UserProfileTool
+
+
+def test_profile_tool_appends_updates_and_reloads(tmp_path):
+    path = tmp_path / "user_profiles.jsonl"
+    tool = UserProfileTool(persist_to_file=True, file_path=path)
+
+    tool.extract_and_store("user-1", "meu email e cliente@example.com")
+    tool.extract_and_store("user-1", "sou do plano pro")
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[-1])["plan"] == "pro"
+
+    reloaded = UserProfileTool(persist_to_file=True, file_path=path)
+    profile = reloaded.get("user-1")
+    assert profile is not None
+    assert profile.email == "cliente@example.com"
+    assert profile.plan == "pro"
+
+
+def test_profile_tool_compacts_stale_log_entries(tmp_path):
+    path = tmp_path / "user_profiles.jsonl"
+    tool = UserProfileTool(persist_to_file=True, file_path=path)
+
+    tool.extract_and_store("user-1", "contato a@example.com")
+    tool.extract_and_store("user-1", "contato b@example.com")
+    tool.extract_and_store("user-1", "contato c@example.com")
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["email"] == "c@example.com"
+
+
+def test_profile_tool_uses_caller_timestamp(tmp_path):
+    tool = UserProfileTool(persist_to_file=False)
+    now = datetime(2025, 9, 1, 12, 0, tzinfo=timezone.utc)
+
+    profile, updates = tool.extract_and_store("user-1", "sou do plano pro", now=now)
+
+    assert updates == {"plan": "pro"}
+    assert profile is not None
+    assert profile.last_updated == now
+
+
+def test_profile_tool_imports_legacy_json_store(tmp_path):
+    legacy = tmp_path / "user_profiles.json"
+    legacy.write_text(
+        json.dumps([{"user_id": "user-1", "email": "antigo@example.com", "plan": "pro", "last_updated": "2024-01-01T00:00:00+00:00"}]),
+        # the shipped data files carry a UTF-8 BOM
+        encoding="utf-8-sig",
+    )
+    path = tmp_path / "user_profiles.jsonl"
+
+    tool = UserProfileTool(persist_to_file=True, file_path=path)
+
+    profile = tool.get("user-1")
+    assert profile is not None
+    assert profile.email == "antigo@example.com"
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+
+    tool.extract_and_store("user-2", "meu email e novo@example.com")
+    reloaded = UserProfileTool(persist_to_file=True, file_path=path)
+    assert reloaded.get("user-1").plan == "pro"
+    assert reloaded.get("user-2").email == "novo@example.com"
+
+
+def test_profile_tool_plan_priority_follows_pattern_order():
+    tool = UserProfileTool(persist_to_file=False)
+
+    _, updates = tool.extract_and_store("user-1", "quero sair do plano start e ir para o plano pro")
+
+    assert updates == {"plan": "pro"}
@@ -91,6 +91,13 @@ def test_mask_pii_respects_disabled_setting(monkeypatch):
     assert _mask_pii(value) == value
 
 
+def test_mask_pii_redacts_opaque_references(monkeypatch):
+    monkeypatch.setattr("app.settings.settings.support_pii_masking_enabled", True, raising=False)
+
+    assert _mask_pii("cliente-abc") == "***"
+    assert _mask_pii("cli-12") == "***"
+
+
 def test_handle_support_returns_faq_result(monkeypatch):
     monkeypatch.setattr("app.settings.settings.support_faq_enabled", True, raising=False)
 
@@ -113,6 +120,7 @@ def test_handle_support_returns_faq_result(monkeypatch):
     assert response["ticket"] is None
     assert response["policy"] is None
     assert response["latency_ms"] > 0
+    assert response["latency_ms"] == round(response["latency_ms"], 2)
     assert response["account_status"] is None
     assert set(response["tools_used"]).issuperset({"user_profile", "faq"})
     assert response["profile_masked"]["user_id"].startswith("cl")
@@ -1,7 +1,6 @@
 ﻿import json
 
 import pytest
-from fastapi.testclient import TestClient
 
 from app.main import app
 from app.schemas import ErrorResponse
@@ -31,11 +30,11 @@ def _build_service(tmp_path):
 
 
 @pytest.fixture
-def client(tmp_path):
+def client(client, tmp_path):
+    # wraps the shared session client with this module's service and ticket
     service, ticket = _build_service(tmp_path)
     app.dependency_overrides[get_support_service] = lambda: service
-    with TestClient(app) as test_client:
-        yield test_client, service, ticket
+    yield client, service, ticket
     app.dependency_overrides.pop(get_support_service, None)
 
 
@@ -65,3 +65,57 @@ def test_ticket_tool_persists_to_file(tmp_path):
     stored = reloaded.get(ticket.id)
     assert stored is not None
     assert stored.escalation is True
+
+
+def test_ticket_tool_appends_one_line_per_ticket(tmp_path):
+    storage: Path = tmp_path / "tickets.json"
+    ids = iter(["SUP-LOG-001", "SUP-LOG-002"])
+    tool = TicketTool(persist_to_file=True, file_path=storage, id_factory=lambda: next(ids))
+
+    for summary in ("Primeiro", "Segundo"):
+        tool.create(TicketCreateRequest(summary=summary, description="", user_id="user-log", category="outros", priority="low"))
+
+    assert len(storage.read_text(encoding="utf-8").splitlines()) == 2
+    reloaded = TicketTool(persist_to_file=True, file_path=storage)
+    assert [ticket.summary for ticket in reloaded.list_by_user("user-log")] == ["Primeiro", "Segundo"]
+
+
+def test_ticket_tool_migrates_legacy_array_file(tmp_path):
+    storage: Path = tmp_path / "tickets.json"
+    storage.write_text(
+        '[{"id": "SUP-OLD-001", "summary": "Antigo", "created_at": "2024-01-01T00:00:00+00:00",'
+        ' "updated_at": "2024-01-01T00:00:00+00:00"}]',
+        encoding="utf-8",
+    )
+
+    tool = TicketTool(persist_to_file=True, file_path=storage, id_factory=lambda: "SUP-NEW-001")
+    tool.create(TicketCreateRequest(summary="Novo", description="", user_id="user-new", category="outros", priority="low"))
+
+    reloaded = TicketTool(persist_to_file=True, file_path=storage)
+    assert reloaded.get("SUP-OLD-001") is not None
+    assert reloaded.get("SUP-NEW-001") is not None
+
+
+def test_ticket_tool_list_by_user_follows_replaced_ids():
+    tool = TicketTool(persist_to_file=False, id_factory=lambda: "SUP-SAME-001")
+
+    for user_id in ("user-a", "user-b"):
+        tool.create(TicketCreateRequest(summary="Teste", description="", user_id=user_id, category="outros", priority="low"))
+
+    assert tool.list_by_user("user-a") == []
+    assert [ticket.user_id for ticket in tool.list_by_user("user-b")] == ["user-b"]
+
+
+def test_ticket_tool_migrates_bom_prefixed_legacy_file(tmp_path, caplog):
+    storage: Path = tmp_path / "tickets.json"
+    storage.write_bytes(b"\xef\xbb\xbf[]\n")
+
+    with caplog.at_level("WARNING"):
+        tool = TicketTool(persist_to_file=True, file_path=storage, id_factory=lambda: "SUP-BOM-001")
+    tool.create(TicketCreateRequest(summary="Novo", description="", user_id="user-bom", category="outros", priority="low"))
+
+    assert not [record for record in caplog.records if record.msg.startswith("support.ticket.persistence")]
+    lines = storage.read_bytes().splitlines()
+    assert len(lines) == 1
+    assert b"SUP-BOM-001" in lines[0]
+    assert TicketTool(persist_to_file=True, file_path=storage).get("SUP-BOM-001") is not None
@@ -0,0 +1,12 @@
+import json
+
+from app.utils.jsonl import dumps_line
+
+
+def test_dumps_line_emits_one_utf8_line():
+    line = dumps_line({"titulo": "Pix parcelado em 12x", "texto": "cartão", "embedding": [0.1, 1e-7]})
+
+    assert line.endswith(b"\n")
+    assert line.count(b"\n") == 1
+    assert "cartão".encode("utf-8") in line
+    assert json.loads(line) == {"titulo": "Pix parcelado em 12x", "texto": "cartão", "embedding": [0.1, 1e-7]}
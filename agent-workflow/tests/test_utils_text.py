@@ -1,4 +1,4 @@
-from app.utils.text import strip_portuguese_accents
+from app.utils.text import strip_accents_and_lower, strip_portuguese_accents
 
 
 def test_strip_portuguese_accents_replaces_common_characters() -> None:
@@ -11,3 +11,10 @@ def test_strip_portuguese_accents_replaces_common_characters() -> None:
 
 def test_strip_portuguese_accents_is_noop_for_empty_input() -> None:
     assert strip_portuguese_accents("") == ""
+
+
+def test_strip_accents_and_lower_matches_two_pass_folding() -> None:
+    text = "PLANO GRÁTIS, Ação e ÓRGÃO Σ"
+
+    assert strip_accents_and_lower(text) == strip_portuguese_accents(text.lower())
+    assert strip_accents_and_lower(text) == "plano gratis, acao e orgao σ"